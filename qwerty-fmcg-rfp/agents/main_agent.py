@@ -1,21 +1,71 @@
 # agents/main_agent.py (COMPLETE FIXED VERSION)
-import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import List, Dict
+from typing import TYPE_CHECKING, List, Dict, Iterator, Optional
 import sys
 import os
 sys.path.append('.')
 
 from agents.sales_agent import SalesAgent
-from agents.technical_agent import TechnicalAgent
-from agents.pricing_agent import PricingAgent
+from utils.catalog_watcher import CatalogSnapshot, CatalogWatcher
+from utils.document_cache import DocumentCache
+from utils.instrumentation import instrument, metrics
+from utils.result_store import ResultStore
+from utils.rfp_segmenter import Section
+
+# The catalog agents (pandas, numpy) and the PDF parser (pdfplumber) are
+# imported where they are first used
+if TYPE_CHECKING:
+    from agents.pricing_agent import PricingAgent
+    from agents.technical_agent import TechnicalAgent
+
+# NH-44 demo scope for run_full_workflow when no tender document is given
+# (the Sales Agent only supplies a title)
+SAMPLE_SCOPE = [
+    {
+        "product_name": "1.1kV Cable 240mm²",
+        "quantity": 1000,
+        "voltage_rating": 1.1,
+        "conductor_size": 240,
+        "material": "Copper",
+        "insulation_type": "XLPE",
+        "core_count": 4,
+        "armoring": "Steel Tape",
+    },
+    {
+        "product_name": "0.6kV Cable 185mm²",
+        "quantity": 500,
+        "voltage_rating": 0.6,
+        "conductor_size": 185,
+        "material": "Copper",
+        "insulation_type": "XLPE",
+        "core_count": 3,
+        "armoring": "Steel Wire",
+    },
+    {
+        "product_name": "0.4kV Cable 50mm²",
+        "quantity": 2000,
+        "voltage_rating": 0.4,
+        "conductor_size": 50,
+        "material": "Copper",
+        "insulation_type": "PVC",
+        "core_count": 2,
+        "armoring": "None",
+    },
+]
+
 
 class MainAgent:
     """Orchestrates entire RFP workflow"""
     
     def __init__(self, catalog_csv: str = "data/products/product_catalog.csv", 
                  product_prices_csv: str = "data/products/product_catalog.csv", 
-                 test_prices_csv: str = "data/pricing/test_prices.csv"):
+                 test_prices_csv: str = "data/pricing/test_prices.csv",
+                 document_cache_dir: str = "data/cache/documents",
+                 watch_catalog: bool = False, reload_interval: float = 2.0,
+                 result_store: str = "data/results/rfp_responses.ndjson"):
+        """watch_catalog rebuilds the catalog and price tables in the background
+        when their CSVs change (see utils.catalog_watcher)"""
         self.name = "Main Agent (Orchestrator)"
         self.catalog_csv = catalog_csv
         self.product_prices_csv = product_prices_csv
@@ -23,16 +73,40 @@ class MainAgent:
         
         # Initialize agents with correct paths
         self.sales_agent = SalesAgent()
-        self.technical_agent = TechnicalAgent(catalog_csv)
-        self.pricing_agent = PricingAgent(product_prices_csv, test_prices_csv)
+        self.catalog = CatalogWatcher([catalog_csv, product_prices_csv, test_prices_csv],
+                                      self._build_catalog_agents, interval=reload_interval)
+        if watch_catalog:
+            self.catalog.start()
+        self.document_cache = DocumentCache(document_cache_dir)
+        self.results = ResultStore(result_store)
         
         print(f"[{self.name}] ✅ Initialized with:")
         print(f"   📁 Catalog: {catalog_csv}")
         print(f"   💰 Pricing: {product_prices_csv}")
         print(f"   🧪 Tests: {test_prices_csv}")
     
-    def run_full_workflow(self):
-        """Main orchestration workflow - NO INPUT NEEDED"""
+    def _build_catalog_agents(self):
+        """Fresh Technical and Pricing agents for one catalog snapshot, sharing one repository"""
+        from agents.pricing_agent import PricingAgent
+        from agents.technical_agent import TechnicalAgent
+        from utils.catalog_repository import CatalogRepository
+        
+        repository = CatalogRepository(self.catalog_csv, self.product_prices_csv)
+        technical_agent = TechnicalAgent(repository)
+        pricing_agent = PricingAgent(repository, self.test_prices_csv, auto_refresh=False)
+        return technical_agent, pricing_agent
+    
+    @property
+    def technical_agent(self) -> "TechnicalAgent":
+        return self.catalog.current.value[0]
+    
+    @property
+    def pricing_agent(self) -> "PricingAgent":
+        return self.catalog.current.value[1]
+    
+    @instrument("main_agent.run_full_workflow")
+    def run_full_workflow(self, rfp_pdf: str = None):
+        """Main orchestration workflow - NO INPUT NEEDED (rfp_pdf optionally supplies the tender document)"""
         
         print("\n" + "=" * 80)
         print("🚀 RFP AGENTIC AI SYSTEM - COMPLETE WORKFLOW")
@@ -44,10 +118,19 @@ class MainAgent:
         selected_rfp = top_rfps[0]  # Top ranked RFP
         print(f"🎯 SELECTED: {selected_rfp['title']} (Fit: {selected_rfp['fit_score']}%)")
         
+        # Matching and pricing both use this snapshot, even if a reload lands mid-run
+        snapshot = self.catalog.current
+        technical_agent, pricing_agent = snapshot.value
+        
         # Step 2: Technical Agent - Match specs
         print("\n>>> STEP 2: TECHNICAL AGENT - Match Specs to OEM Products")
-        # Pass RFP title as text (mock PDF content)
-        technical_result = self.technical_agent.execute(selected_rfp['title'])
+        if rfp_pdf:
+            rfp_text, sections = self._load_document(rfp_pdf)
+            technical_result = technical_agent.execute(rfp_text, sections)
+        else:
+            # A title has no line items to extract, so the demo runs on the sample scope
+            print(f"[{self.name}] ⚠️ No tender document - using the NH-44 sample scope")
+            technical_result = technical_agent.match_scope([dict(item) for item in SAMPLE_SCOPE])
         
         # Print top matches
         print(f"\n[{self.name}] Top recommendations:")
@@ -57,11 +140,11 @@ class MainAgent:
         
         # Step 3: Pricing Agent - Calculate costs
         print("\n>>> STEP 3: PRICING AGENT - Calculate Costs")
-        pricing_result = self.pricing_agent.execute(technical_result)
+        pricing_result = pricing_agent.execute(technical_result)
         
         # Step 4: Consolidate & Save
         print("\n>>> STEP 4: MAIN AGENT - Consolidate Response")
-        final_response = self.consolidate_response(selected_rfp, technical_result, pricing_result)
+        final_response = self.consolidate_response(selected_rfp, technical_result, pricing_result, snapshot)
         
         # Save & Display
         self.save_response(final_response)
@@ -69,8 +152,75 @@ class MainAgent:
         
         return final_response
     
-    def consolidate_response(self, rfp: Dict, technical: Dict, pricing: Dict) -> Dict:
+    def _load_document(self, rfp_pdf: str):
+        """RFP text and section offsets for a tender PDF"""
+        from utils.pdf_parser import parse_rfp_document
+        
+        # Unchanged documents come straight from the content-addressed cache
+        document = parse_rfp_document(rfp_pdf, self.document_cache)
+        sections = [Section(*s) for s in document["sections"]] if "sections" in document else None
+        stats = self.document_cache.stats()
+        print(f"[{self.name}] 📄 Document cache: {stats['hits']} hit(s), {stats['misses']} miss(es)")
+        return document["text"], sections
+    
+    @staticmethod
+    def _scope_text(rfp: Dict) -> str:
+        """Line-item text built from the product list the Sales Agent found"""
+        return "\n".join(f"Item {i}: {product}" for i, product in enumerate(rfp.get("products", []), 1))
+    
+    @instrument("main_agent.process_rfp")
+    def process_rfp(self, rfp: Dict, rfp_pdf: Optional[str] = None, rfp_text: Optional[str] = None,
+                    extra_tests: Optional[List[str]] = None) -> Dict:
+        """Technical matching, pricing and consolidation for one RFP"""
+        sections = None
+        if rfp_pdf:
+            rfp_text, sections = self._load_document(rfp_pdf)
+        elif not rfp_text:
+            rfp_text = self._scope_text(rfp)
+        snapshot = self.catalog.current
+        technical_agent, pricing_agent = snapshot.value
+        technical_result = technical_agent.execute(rfp_text, sections)
+        pricing_result = pricing_agent.execute(technical_result, extra_tests)
+        return self.consolidate_response(rfp, technical_result, pricing_result, snapshot)
+    
+    def run_batch_workflow(self, max_workers: int = 4, statuses=("GREEN", "YELLOW"),
+                           rfp_pdfs: Optional[Dict[str, str]] = None) -> Iterator[Dict]:
+        """Bid on every ranked RFP with a matching status, yielding each response as it finishes
+        
+        Workers are threads, so they all share this agent's loaded catalog and
+        price tables. rfp_pdfs optionally maps RFP id -> tender document;
+        RFPs without one are scoped from their Sales Agent product list.
+        statuses=None processes every ranked RFP. Each response is appended
+        to the result store as it finishes.
+        """
+        print("\n" + "=" * 80)
+        print("🚀 RFP AGENTIC AI SYSTEM - BATCH WORKFLOW")
+        print("=" * 80)
+        
+        ranked_rfps = self.sales_agent.scan_portals()
+        selected = [
+            rfp for rfp in ranked_rfps
+            if statuses is None or any(status in rfp["status"] for status in statuses)
+        ]
+        print(f"[{self.name}] 📦 {len(selected)} of {len(ranked_rfps)} RFPs selected for bidding")
+        rfp_pdfs = rfp_pdfs or {}
+        
+        pool = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            futures = {pool.submit(self.process_rfp, rfp, rfp_pdfs.get(rfp["id"])): rfp for rfp in selected}
+            for future in as_completed(futures):
+                response = future.result()
+                self.results.append(response)
+                print(f"[{self.name}] ✓ {response['rfp_id']}: ₹{response['pricing_summary']['grand_total']:,.0f}")
+                yield response
+        finally:
+            # Stop queued RFPs if the caller stops consuming early
+            pool.shutdown(wait=True, cancel_futures=True)
+    
+    def consolidate_response(self, rfp: Dict, technical: Dict, pricing: Dict,
+                             snapshot: Optional[CatalogSnapshot] = None) -> Dict:
         """Consolidate all results"""
+        snapshot = snapshot or self.catalog.current
         return {
             "rfp_id": rfp.get("id", "N/A"),
             "project_name": rfp.get("title", "N/A"),
@@ -85,14 +235,19 @@ class MainAgent:
                 "grand_total": pricing["grand_total"]
             },
             "status": "Ready for Review ✓",
+            "catalog_version": snapshot.version,
+            "catalog_loaded_at": datetime.fromtimestamp(snapshot.loaded_at).isoformat(),
             "generated_at": datetime.now().isoformat()
         }
     
     def save_response(self, response: Dict):
-        """Save to JSON"""
-        with open("rfp_response.json", "w") as f:
-            json.dump(response, f, indent=2, default=str)
-        print(f"\n[{self.name}] ✓ Response saved to: rfp_response.json")
+        """Append to the result store (earlier responses are kept)"""
+        entry = self.results.append(response)
+        print(f"\n[{self.name}] ✓ Response saved to: {self.results.path} ({entry.rfp_id} @ {entry.generated_at})")
+    
+    def close(self):
+        """Stop the catalog watcher, if running"""
+        self.catalog.stop()
     
     def display_summary(self, response: Dict):
         """Display final summary"""
@@ -109,7 +264,22 @@ class MainAgent:
         print(f"\n✅ Status: {response['status']}")
         print("=" * 80)
 
+def run_with_metrics():
+    """Full workflow honoring RFP_PROFILE=<file.prof> and RFP_METRICS_PATH"""
+    metrics_path = os.environ.get("RFP_METRICS_PATH", "rfp_metrics.json")
+    profile_path = os.environ.get("RFP_PROFILE")
+    if profile_path:
+        with metrics.session(profile_path=profile_path, trace_memory=True):
+            result = MainAgent().run_full_workflow()
+            metrics.save(metrics_path)
+    else:
+        result = MainAgent().run_full_workflow()
+        if metrics.enabled:
+            metrics.save(metrics_path)
+    if metrics.enabled or profile_path:
+        print(f"📊 Stage metrics saved to: {metrics_path}")
+    return result
+
 # Test runner
 if __name__ == "__main__":
-    main = MainAgent()
-    result = main.run_full_workflow()
+    result = run_with_metrics()
@@ -1,37 +1,93 @@
+import os
+import numpy as np
 import pandas as pd
-from typing import List, Dict
+from typing import List, Dict, Optional, Union
+
+from utils.agent_logging import ITEM, get_logger
+from utils.catalog_repository import CatalogRepository
+from utils.instrumentation import instrument
 
 class PricingAgent:
 
     """Calculates costs"""
 
-    def __init__(self, product_prices_csv: str, test_prices_csv: str):
+    @instrument("pricing_agent.load_tables")
+    def __init__(self, product_prices: Union[str, CatalogRepository], test_prices_csv: str,
+                 auto_refresh: bool = True):
+        """product_prices is a shared CatalogRepository, or a price table path to load one from.
+        auto_refresh reloads test prices in place when the CSV changes; pass
+        False when a CatalogWatcher owns reloads, so each instance is a fixed snapshot"""
         self.name = "Pricing Agent"
-        self.product_prices = pd.read_csv(product_prices_csv)
-        self.test_prices = pd.read_csv(test_prices_csv)
-        print(f"[{self.name}] Loaded pricing tables")
+        self.log = get_logger(self.name)
+        if not isinstance(product_prices, CatalogRepository):
+            product_prices = CatalogRepository(product_prices)
+        self.repository = product_prices
+        self.product_prices = product_prices.product_prices
+        self.test_prices_csv = test_prices_csv
+        self.auto_refresh = auto_refresh
+        self._test_prices_mtime = None
+        self._load_test_prices()
+        self._build_sku_index()
+        self.log.info("Loaded pricing tables")
+
+    def _build_sku_index(self):
+        """Unit price and lead time by SKU, from the repository's shared index"""
+        sku_index = self.repository.sku_index
+        self._sku_index: Dict[str, int] = sku_index.positions
+        self._unit_prices = sku_index.unit_prices
+        self._lead_times = sku_index.lead_times
+
+    def get_unit_price(self, sku: str) -> float:
+        """Unit price per meter for a SKU (0 when the SKU is unknown)"""
+        position = self._sku_index.get(sku)
+        return float(self._unit_prices[position]) if position is not None else 0
+
+    def get_lead_time(self, sku: str) -> Optional[int]:
+        """Lead time in days for a SKU (None when unknown or not in the price table)"""
+        position = self._sku_index.get(sku)
+        if position is None or self._lead_times is None:
+            return None
+        return int(self._lead_times[position])
 
     def calculate_material_cost(self, sku: str, quantity: float) -> float:
         """Calculate material cost"""
-        # Find unit price
-        row = self.product_prices[self.product_prices["product_sku"] == sku]
-        if not row.empty:
-            unit_price = float(row.iloc[0]["unit_price_per_meter"])  # Fixed iloc usage
-            return unit_price * quantity
+        position = self._sku_index.get(sku)
+        if position is not None:
+            return float(self._unit_prices[position]) * quantity
         return 0
 
-    def calculate_test_cost(self, quantity: float) -> Dict:
-        """Calculate test costs"""
-        # Mandatory tests
-        mandatory_tests = self.test_prices[self.test_prices["mandatory"] == "Yes"]
-
+    def price_many(self, skus: List[str], quantities: List[float]) -> np.ndarray:
+        """Line costs for many SKUs at once (unknown SKUs cost 0)"""
+        positions = np.array([self._sku_index.get(sku, -1) for sku in skus], dtype=int)
+        known = positions >= 0
+        unit_prices = np.zeros(len(positions))
+        unit_prices[known] = self._unit_prices[positions[known]]
+        return unit_prices * np.asarray(quantities, dtype=float)
+
+    def _load_test_prices(self):
+        """Read test_prices.csv and precompute the per-test vectors and mandatory breakdown"""
+        self._test_prices_mtime = os.path.getmtime(self.test_prices_csv)
+        self.test_prices = pd.read_csv(self.test_prices_csv)
+        self._test_types = self.test_prices["test_type"].tolist()
+        self._test_costs = self.test_prices["unit_cost_rupees"].to_numpy(dtype=float)
+        self._test_mandatory = (self.test_prices["mandatory"] == "Yes").to_numpy()
+        self._test_index = {test_type: i for i, test_type in enumerate(self._test_types)}
+        self._mandatory_test_cost = self._summarize_tests(self._test_mandatory)
+
+    def _refresh_test_prices(self):
+        """Reload the test price table only if the CSV changed on disk"""
+        if os.path.getmtime(self.test_prices_csv) != self._test_prices_mtime:
+            self._load_test_prices()
+            self.log.info("Reloaded test prices from %s", self.test_prices_csv)
+
+    def _summarize_tests(self, selected: np.ndarray) -> Dict:
+        """Itemized breakdown and total for the selected tests, in CSV order"""
         test_breakdown = {}
         total_test_cost = 0
 
-        for _, test_row in mandatory_tests.iterrows():
-            test_type = test_row["test_type"]
-            test_cost = float(test_row["unit_cost_rupees"])
-            test_breakdown[test_type] = test_cost
+        for i in np.flatnonzero(selected):
+            test_cost = float(self._test_costs[i])
+            test_breakdown[self._test_types[i]] = test_cost
             total_test_cost += test_cost
 
         return {
@@ -39,17 +95,38 @@ class PricingAgent:
             "total": total_test_cost
         }
 
-    def execute(self, technical_recommendations: Dict) -> Dict:
+    def calculate_test_cost(self, quantity: float, extra_tests: Optional[List[str]] = None) -> Dict:
+        """Calculate test costs (mandatory tests plus any optional tests the RFP asks for)"""
+        if self.auto_refresh:
+            self._refresh_test_prices()
+
+        if not extra_tests:
+            cached = self._mandatory_test_cost
+            return {"itemized": dict(cached["itemized"]), "total": cached["total"]}
+
+        selected = self._test_mandatory.copy()
+        for test_type in extra_tests:
+            position = self._test_index.get(test_type)
+            if position is None:
+                self.log.warning("⚠️ Unknown test type: %s", test_type)
+                continue
+            selected[position] = True
+
+        return self._summarize_tests(selected)
+
+    @instrument("pricing_agent.execute")
+    def execute(self, technical_recommendations: Dict, extra_tests: Optional[List[str]] = None) -> Dict:
         """Main workflow"""
-        print(f"\n[{self.name}] ════════════════════════════════════════")
-        print(f"[{self.name}] STARTING PRICING AGENT")
-        print(f"[{self.name}] ════════════════════════════════════════")
+        self.log.info("\n════════════════════════════════════════")
+        self.log.info("STARTING PRICING AGENT")
+        self.log.info("════════════════════════════════════════")
+        log_items = self.log.isEnabledFor(ITEM)
 
         detailed_pricing = []
         total_material_cost = 0
 
         # Calculate test costs once (shared across all products)
-        test_costs = self.calculate_test_cost(quantity=1)  # quantity not needed here for test, kept for signature
+        test_costs = self.calculate_test_cost(quantity=1, extra_tests=extra_tests)  # quantity not needed here for test, kept for signature
         total_test_cost = test_costs["total"]
 
         for product_name, rec in technical_recommendations["recommendations"].items():
@@ -59,8 +136,7 @@ class PricingAgent:
             material_cost = self.calculate_material_cost(sku, quantity)
             total_material_cost += material_cost
 
-            unit_price = self.product_prices[self.product_prices["product_sku"] == sku]
-            unit_price = float(unit_price.iloc[0]["unit_price_per_meter"]) if not unit_price.empty else 0
+            unit_price = self.get_unit_price(sku)
 
             detailed_pricing.append({
                 "product": product_name,
@@ -70,19 +146,23 @@ class PricingAgent:
                 "material_cost": material_cost
             })
 
-            print(f"[{self.name}] {product_name}")
-            print(f"[{self.name}] SKU: {sku}")
-            print(f"[{self.name}] Quantity: {quantity}m")
-            print(f"[{self.name}] Material Cost: ₹{material_cost:,.0f}")
+            if log_items:
+                data = {"product": product_name, "sku": sku, "quantity": quantity, "material_cost": material_cost}
+                self.log.log(ITEM, "%s", product_name, extra={"data": data})
+                self.log.log(ITEM, "SKU: %s", sku)
+                self.log.log(ITEM, "Quantity: %sm", quantity)
+                self.log.log(ITEM, "Material Cost: ₹%s", f"{material_cost:,.0f}")
 
         grand_total = total_material_cost + total_test_cost
 
-        print(f"\n[{self.name}] ════════════════════════════════════════")
-        print(f"[{self.name}] COST SUMMARY:")
-        print(f"[{self.name}] Material Cost: ₹{total_material_cost:,.0f}")
-        print(f"[{self.name}] Test Cost: ₹{total_test_cost:,.0f}")
-        print(f"[{self.name}] GRAND TOTAL: ₹{grand_total:,.0f}")
-        print(f"[{self.name}] ════════════════════════════════════════")
+        self.log.info("\n════════════════════════════════════════")
+        self.log.info("COST SUMMARY:")
+        self.log.info("Material Cost: ₹%s", f"{total_material_cost:,.0f}")
+        self.log.info("Test Cost: ₹%s", f"{total_test_cost:,.0f}")
+        self.log.info("GRAND TOTAL: ₹%s", f"{grand_total:,.0f}",
+                      extra={"data": {"material_cost": total_material_cost, "test_cost": total_test_cost,
+                                      "grand_total": grand_total}})
+        self.log.info("════════════════════════════════════════")
 
         return {
             "detailed_pricing": detailed_pricing,
@@ -1,13 +1,65 @@
 # FILE: agents/sales_agent.py (COMPLETE FIXED VERSION)
-import requests
-from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
 import re
-import pandas as pd
 import os
+import heapq
+from functools import lru_cache
+
+from utils.agent_logging import ITEM, get_logger
+from utils.instrumentation import instrument
+
+CABLE_KEYWORDS = ['cable', '1.1kV', '0.6kV', 'XLPE', 'copper']
+PRIORITY_CLIENTS = ['National Highway Authority', 'Power Grid', 'Indian Railways', 'GeM']
+
+
+def _compile_matcher(terms, ignore_case):
+    """One regex for all terms; the lookahead reports a match at every start position"""
+    alternation = '|'.join(re.escape(t) for t in sorted(terms, key=len, reverse=True))
+    return re.compile(f'(?=({alternation}))', re.IGNORECASE if ignore_case else 0)
+
+
+# Keyword hits count each keyword once, case-insensitively, anywhere in the text
+KEYWORD_MATCHER = _compile_matcher(CABLE_KEYWORDS, ignore_case=True)
+# A keyword contained in a matched keyword also matches (the regex reports only one per position)
+KEYWORD_IMPLIES = {
+    kw.lower(): {other.lower() for other in CABLE_KEYWORDS if other.lower() in kw.lower()}
+    for kw in CABLE_KEYWORDS
+}
+# Same comparison as before: the literal client names against the lowercased client
+CLIENT_MATCHER = _compile_matcher(PRIORITY_CLIENTS, ignore_case=False)
+
+FINGERPRINT_STRIP = re.compile(r'[^a-z0-9]+')
+
+
+@lru_cache(maxsize=4096)
+def _parse_due_date(due_date):
+    """Parse a due date once per distinct string (None if it is not YYYY-MM-DD)"""
+    try:
+        return datetime.strptime(due_date, '%Y-%m-%d')
+    except ValueError:
+        return None
+
+
+def _normalize(value, sep=' '):
+    return FINGERPRINT_STRIP.sub(sep, str(value or '').lower()).strip()
+
+
+def rfp_fingerprints(rfp):
+    """Normalized id and tender keys used to spot the same tender across portals
+
+    A portal's own listing id differs from portal to portal, so the tender key
+    is the title together with the client and due date: two tenders that only
+    share a generic title ("Supply of LT Cables") are kept apart.
+    """
+    rfp_id = _normalize(rfp.get('id'), '')
+    title = _normalize(rfp.get('title'))
+    tender = (title, _normalize(rfp.get('client')), _normalize(rfp.get('due_date')))
+    return ('id', rfp_id) if rfp_id else None, ('tender',) + tender if title else None
+
 
 class SalesAgent:
     def __init__(self):
+        self.log = get_logger("Sales Agent")
         self.rfp_portals = [
             # REAL INDIAN GOVERNMENT PORTALS 
             "https://eprocure.gov.in/eprocure/app",
@@ -29,26 +81,60 @@ class SalesAgent:
             try:
                 with open(urls_file, 'r') as f:
                     self.urls = [line.strip() for line in f if line.strip()]
-                print(f"[Sales Agent] 📁 Loaded {len(self.urls)} URLs from data/urls.txt")
+                self.log.info("📁 Loaded %d URLs from data/urls.txt", len(self.urls))
             except Exception as e:
-                print(f"[Sales Agent] ⚠️ urls.txt error: {e}")
+                self.log.warning("⚠️ urls.txt error: %s", e)
                 self.urls = self.rfp_portals
         else:
-            print("[Sales Agent] 📝 Create data/urls.txt for real scanning")
+            self.log.info("📝 Create data/urls.txt for real scanning")
             self.urls = self.rfp_portals
     
-    def scan_portals(self):
-        """Scan 20+ RFP portals daily"""
-        print(f"[Sales Agent] 🔍 Scanning {len(self.urls)} portals...")
+    @instrument("sales_agent.scan_portals")
+    def scan_portals(self, live: bool = False, incremental: bool = False, **fetcher_options):
+        """Scan 20+ RFP portals daily (live=True fetches self.urls concurrently)"""
+        if live:
+            import asyncio
+            return asyncio.run(self.scan_portals_async(incremental, **fetcher_options))
+        
+        self.log.info("🔍 Scanning %d portals...", len(self.urls))
         
         # SIMULATED SCAN + REAL URL ATTEMPT
         rfps = self._parse_sample_rfps()
         rfps.extend(self._mock_real_parsing())
         
+        return self._report_ranked(rfps)
+    
+    async def scan_portals_async(self, incremental: bool = False,
+                                 cache_path: str = "data/cache/portal_cache.json",
+                                 cache_max_entries: int = 500, **fetcher_options):
+        """Fetch all portal URLs concurrently and rank the RFPs found on them
+        
+        incremental=True keeps a per-URL cache so only new or changed RFPs are ranked.
+        """
+        # requests and bs4 are only loaded for live scans
+        from utils.portal_cache import PortalCache
+        from utils.portal_fetcher import PortalFetcher, extract_url
+        
+        urls = [url for url in (extract_url(line) for line in self.urls) if url]
+        self.log.info("🔍 Scanning %d portals concurrently...", len(urls))
+        
+        cache = PortalCache(cache_path, cache_max_entries) if incremental else None
+        fetcher = PortalFetcher(**fetcher_options)
+        try:
+            rfps = await fetcher.scan(urls, cache)
+        finally:
+            fetcher.close()
+        
+        return self._report_ranked(rfps)
+    
+    def _report_ranked(self, rfps):
+        """Rank RFPs and print the top three"""
         ranked_rfps = self._rank_by_strategic_fit(rfps)
-        print(f"[Sales Agent] 🎯 Found {len(ranked_rfps)} RFPs - Top ranked:")
-        for i, rfp in enumerate(ranked_rfps[:3], 1):
-            print(f"   {i}. {rfp['title'][:50]}... (Fit: {rfp['fit_score']}%) [{rfp['status']}]")
+        self.log.info("🎯 Found %d RFPs - Top ranked:", len(ranked_rfps))
+        if self.log.isEnabledFor(ITEM):
+            for i, rfp in enumerate(ranked_rfps[:3], 1):
+                self.log.log(ITEM, "   %d. %s... (Fit: %s%%) [%s]", i, rfp['title'][:50], rfp['fit_score'], rfp['status'],
+                             extra={"data": {"rfp_id": rfp["id"], "fit_score": rfp["fit_score"]}})
         
         return ranked_rfps
     
@@ -101,47 +187,68 @@ class SalesAgent:
             'keywords': ['cable', '1.1kV', 'electrification']
         }]
     
-    def _rank_by_strategic_fit(self, rfps):
-        """Calculate strategic fit score (0-100%)"""
-        scores = []
+    @instrument("sales_agent.rank")
+    def _rank_by_strategic_fit(self, rfps, top_n=None):
+        """Calculate strategic fit score (0-100%), dedup, and return the top N (all if None)"""
+        scored = self.iter_scored_rfps(rfps)
+        if top_n is None:
+            return sorted(scored, key=lambda x: x['fit_score'], reverse=True)
+        # Same order as the full sort, without sorting the whole feed
+        return heapq.nlargest(top_n, scored, key=lambda x: x['fit_score'])
+    
+    def iter_scored_rfps(self, rfps, dedup=True):
+        """Stream scored RFPs from any iterable, dropping tenders already seen on another portal"""
+        seen = set()
+        now = datetime.now()
         
         for rfp in rfps:
-            score = 0
-            
-            # Keyword match (40 points)
-            cable_keywords = ['cable', '1.1kV', '0.6kV', 'XLPE', 'copper']
-            keyword_hits = sum(1 for kw in cable_keywords if kw.lower() in ' '.join(rfp['keywords']).lower())
-            score += min(40, keyword_hits * 10)
-            
-            # Client priority (30 points)
-            priority_clients = ['National Highway Authority', 'Power Grid', 'Indian Railways', 'GeM']
-            client_lower = rfp['client'].lower()
-            if any(client in client_lower for client in priority_clients):
-                score += 30
-            
-            # Value (20 points)
-            if '15 Cr' in rfp['value']: score += 20
-            elif '12 Cr' in rfp['value'] or '8 Cr' in rfp['value']: score += 15
-            else: score += 10
+            if dedup:
+                keys = [key for key in rfp_fingerprints(rfp) if key]
+                if any(key in seen for key in keys):
+                    continue
+                seen.update(keys)
             
-            # Due date urgency (10 points) ✅ FIXED: Error handling
-            try:
-                due_date = datetime.strptime(rfp['due_date'], '%Y-%m-%d')
-                days_left = (due_date - datetime.now()).days
-                if days_left <= 30: 
-                    score += 10
-                elif days_left <= 60:
-                    score += 5
-            except:
-                score += 5  # Default points
-            
-            scores.append({
-                **rfp,
-                'fit_score': round(score, 1),
-                'status': '🟢 GREEN' if score >= 90 else '🟡 YELLOW' if score >= 70 else '🔴 RED'
-            })
+            yield self._score_rfp(rfp, now)
+    
+    def _score_rfp(self, rfp, now):
+        """Strategic fit score for one RFP"""
+        score = 0
+        
+        # Keyword match (40 points)
+        keyword_text = ' '.join(rfp['keywords'])
+        matched = set()
+        for m in KEYWORD_MATCHER.finditer(keyword_text):
+            matched |= KEYWORD_IMPLIES[m.group(1).lower()]
+        score += min(40, len(matched) * 10)
+        
+        # Client priority (30 points)
+        if CLIENT_MATCHER.search(rfp['client'].lower()):
+            score += 30
+        
+        # Value (20 points)
+        if '15 Cr' in rfp['value']: score += 20
+        elif '12 Cr' in rfp['value'] or '8 Cr' in rfp['value']: score += 15
+        else: score += 10
+        
+        # Due date urgency (10 points) ✅ FIXED: Error handling
+        try:
+            due_date = _parse_due_date(rfp['due_date'])
+        except Exception:
+            due_date = None
+        if due_date is None:
+            score += 5  # Default points
+        else:
+            days_left = (due_date - now).days
+            if days_left <= 30: 
+                score += 10
+            elif days_left <= 60:
+                score += 5
         
-        return sorted(scores, key=lambda x: x['fit_score'], reverse=True)
+        return {
+            **rfp,
+            'fit_score': round(score, 1),
+            'status': '🟢 GREEN' if score >= 90 else '🟡 YELLOW' if score >= 70 else '🔴 RED'
+        }
 
 # Test the agent
 if __name__ == "__main__":
@@ -1,73 +1,65 @@
-from typing import List, Dict
+from typing import List, Dict, Optional, Union
 
+from utils.agent_logging import ITEM, get_logger
+from utils.catalog_repository import CatalogRepository
+from utils.instrumentation import instrument
+from utils.rfp_segmenter import Section, segment_sections
+from utils.scope_extractor import extract_line_items
 from utils.spec_matcher import SpecMatcher
 
 class TechnicalAgent:
 
     """Matches RFP specs to OEM products"""
 
-    def __init__(self, catalog_csv_path: str):
+    def __init__(self, catalog: Union[str, CatalogRepository]):
+        """catalog is a shared CatalogRepository, or a catalog path to load one from"""
         self.name = "Technical Agent"
-        self.matcher = SpecMatcher(catalog_csv_path)
+        self.log = get_logger(self.name)
+        self.matcher = SpecMatcher(catalog)
 
-    def extract_scope_from_rfp(self, rfp_text: str) -> List[Dict]:
-        """Extract products from RFP scope (mocked for now)"""
-        scope = [
-            {
-                "product_name": "1.1kV Cable 240mm²",
-                "quantity": 1000,
-                "voltage_rating": 1.1,
-                "conductor_size": 240,
-                "material": "Copper",
-                "insulation_type": "XLPE",
-                "core_count": 4,
-                "armoring": "Steel Tape",
-            },
-            {
-                "product_name": "0.6kV Cable 185mm²",
-                "quantity": 500,
-                "voltage_rating": 0.6,
-                "conductor_size": 185,
-                "material": "Copper",
-                "insulation_type": "XLPE",
-                "core_count": 3,
-                "armoring": "Steel Wire",
-            },
-            {
-                "product_name": "0.4kV Cable 50mm²",
-                "quantity": 2000,
-                "voltage_rating": 0.4,
-                "conductor_size": 50,
-                "material": "Copper",
-                "insulation_type": "PVC",
-                "core_count": 2,
-                "armoring": "None",
-            },
-        ]
+    @instrument("technical_agent.extract_scope")
+    def extract_scope_from_rfp(self, rfp_text: str, sections: Optional[List[Section]] = None) -> List[Dict]:
+        """Extract products from the RFP scope of supply
+
+        sections are offsets from utils.rfp_segmenter; pass them in when the
+        document has already been segmented to avoid scanning it again.
+        """
+        if sections is None:
+            sections = segment_sections(rfp_text)
+        scope = extract_line_items(rfp_text, sections)
+        if not scope:
+            self.log.warning("⚠️ No line items found in RFP text")
         return scope
 
-    def execute(self, rfp_text: str) -> Dict:
+    @instrument("technical_agent.execute")
+    def execute(self, rfp_text: str, sections: Optional[List[Section]] = None) -> Dict:
         """Main workflow"""
-        print(f"\n[{self.name}] ════════════════════════════════════════")
-        print(f"[{self.name}] STARTING TECHNICAL AGENT")
-        print(f"[{self.name}] ════════════════════════════════════════")
+        self.log.info("\n════════════════════════════════════════")
+        self.log.info("STARTING TECHNICAL AGENT")
+        self.log.info("════════════════════════════════════════")
+
+        scope = self.extract_scope_from_rfp(rfp_text, sections)
+        self.log.info("Extracted %d products from RFP scope", len(scope))
+        return self.match_scope(scope)
 
-        scope = self.extract_scope_from_rfp(rfp_text)
-        print(f"[{self.name}] Extracted {len(scope)} products from RFP scope")
+    def match_scope(self, scope: List[Dict], top_k: int = 3) -> Dict:
+        """Recommendations and comparison tables for already-extracted line items"""
+        log_items = self.log.isEnabledFor(ITEM)
 
         recommendations: Dict[str, Dict] = {}
         comparison_tables: Dict[str, str] = {}
 
-        for product in scope:
-            print(f"\n[{self.name}] Processing: {product['product_name']}")
-            # Find top 3 matches
-            top_matches = self.matcher.find_top_matches(product, top_k=3)
-            print(f"[{self.name}] Top 3 matches found:")
-            for match in top_matches:
-                print(
-                    f"[{self.name}] {match['rank']}. {match['sku']}: "
-                    f"{match['match_score']:.1f}% match"
-                )
+        # Find top matches for every line item in one pass over the catalog
+        all_matches = self.matcher.find_top_matches_batch(scope, top_k=top_k)
+
+        for product, top_matches in zip(scope, all_matches):
+            if log_items:
+                self.log.log(ITEM, "\nProcessing: %s", product["product_name"])
+                self.log.log(ITEM, "Top %d matches found:", top_k)
+                for match in top_matches:
+                    self.log.log(ITEM, "%s. %s: %.1f%% match", match["rank"], match["sku"], match["match_score"],
+                                 extra={"data": {"product": product["product_name"], "rank": match["rank"],
+                                                 "sku": match["sku"], "match_score": match["match_score"]}})
 
             recommendations[product["product_name"]] = {
                 "rfp_spec": product,
@@ -0,0 +1,259 @@
+# app.py - RFP agent service
+# Run from the project root: uvicorn app:app --host 0.0.0.0 --port 8000
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Optional, Union
+
+from fastapi import FastAPI, HTTPException
+from pydantic import BaseModel, ConfigDict, Field
+
+from agents.main_agent import MainAgent
+from utils.agent_logging import get_logger, set_quiet
+
+# RFP_WORKERS sizes the worker pool. With RFP_WORKER_PROCESSES=1 the workers
+# are spawned processes, each warming (and watching) its own MainAgent;
+# otherwise they are threads sharing the agent loaded at startup.
+WORKERS = int(os.environ.get("RFP_WORKERS", os.cpu_count() or 1))
+USE_PROCESSES = os.environ.get("RFP_WORKER_PROCESSES", "") not in ("", "0")
+# Catalog and price CSVs are polled for changes and reloaded without a restart
+WATCH_CATALOG = os.environ.get("RFP_WATCH_CATALOG", "1") != "0"
+RELOAD_INTERVAL = float(os.environ.get("RFP_RELOAD_INTERVAL", 2.0))
+
+log = get_logger("API")
+
+# The warm agent for this process (the server, or one pool worker)
+_agent: Optional[MainAgent] = None
+
+
+def _warm_agent() -> MainAgent:
+    """Load the catalog and price tables once per process"""
+    global _agent
+    if _agent is None:
+        # Per-item lines would be written for every request
+        if not os.environ.get("RFP_LOG_LEVEL"):
+            set_quiet()
+        _agent = MainAgent(watch_catalog=WATCH_CATALOG, reload_interval=RELOAD_INTERVAL)
+    return _agent
+
+
+def _warm_agent_ready() -> bool:
+    return _warm_agent() is not None
+
+
+def _catalog_status() -> Dict:
+    """Catalog this process is serving"""
+    snapshot = _warm_agent().catalog.current
+    return {"products": len(snapshot.value[0].matcher.catalog), "version": snapshot.version}
+
+
+# ===== WORKER FUNCTIONS (run in the pool, never on the event loop) =====
+
+def _match(products: Optional[List[Dict]], rfp_text: Optional[str], top_k: int) -> Dict:
+    snapshot = _warm_agent().catalog.current
+    technical_agent = snapshot.value[0]
+    if products:
+        result = technical_agent.match_scope(products, top_k=top_k)
+    else:
+        result = technical_agent.execute(rfp_text)
+    result["catalog_version"] = snapshot.version
+    return result
+
+
+def _price(recommendations: Dict, extra_tests: Optional[List[str]]) -> Dict:
+    snapshot = _warm_agent().catalog.current
+    result = snapshot.value[1].execute({"recommendations": recommendations}, extra_tests)
+    result["catalog_version"] = snapshot.version
+    return result
+
+
+def _ranked_rfps() -> List[Dict]:
+    return _warm_agent().sales_agent.scan_portals()
+
+
+def _proposal(rfp: Optional[Dict], rfp_id: Optional[str], rfp_text: Optional[str],
+              extra_tests: Optional[List[str]]) -> Optional[Dict]:
+    """Response for the given RFP record, or a ranked RFP (None when rfp_id is not ranked)"""
+    agent = _warm_agent()
+    if rfp is None:
+        ranked = agent.sales_agent.scan_portals()
+        if rfp_id is None:
+            rfp = ranked[0]
+        else:
+            rfp = next((r for r in ranked if r["id"] == rfp_id), None)
+            if rfp is None:
+                return None
+    response = agent.process_rfp(rfp, rfp_text=rfp_text, extra_tests=extra_tests)
+    agent.results.append(response)
+    return response
+
+
+def _stored_proposal(rfp_id: str, generated_at: Optional[str]) -> Optional[Dict]:
+    return _warm_agent().results.get(rfp_id, generated_at)
+
+
+# ===== REQUEST MODELS =====
+
+# Requests are validated here, so anything the workers raise is a server error.
+# ints stay ints: the matcher compares spec values as text.
+Number = Union[int, float]
+
+
+class LineItem(BaseModel):
+    """One line-item spec; keys beyond these are passed through to the matcher"""
+    model_config = ConfigDict(extra="allow")
+
+    product_name: str
+    quantity: Number = Field(..., ge=0, description="Metres")
+    voltage_rating: Optional[Number] = None
+    conductor_size: Optional[Number] = None
+    material: Optional[str] = None
+    insulation_type: Optional[str] = None
+    core_count: Optional[Number] = None
+    armoring: Optional[str] = None
+
+
+class PricedSpec(BaseModel):
+    """The rfp_spec of a recommendation; pricing only needs its quantity"""
+    model_config = ConfigDict(extra="allow")
+
+    quantity: Number = Field(..., ge=0)
+
+
+class Recommendation(BaseModel):
+    """One entry of /match's recommendations (matches, scores, ... pass through)"""
+    model_config = ConfigDict(extra="allow")
+
+    selected_sku: str
+    rfp_spec: PricedSpec
+
+
+class MatchRequest(BaseModel):
+    products: Optional[List[LineItem]] = Field(None, description="Line-item specs (product_name, quantity, voltage_rating, ...)")
+    rfp_text: Optional[str] = Field(None, description="RFP text to extract the scope of supply from")
+    top_k: int = Field(3, ge=1, le=50)
+
+
+class PriceRequest(BaseModel):
+    recommendations: Dict[str, Recommendation] = Field(..., description="'recommendations' from /match")
+    extra_tests: Optional[List[str]] = None
+
+
+class ProposalRequest(BaseModel):
+    rfp: Optional[Dict[str, Any]] = Field(None, description="RFP record; defaults to the top ranked RFP")
+    rfp_id: Optional[str] = Field(None, description="Pick a ranked RFP by id instead of passing one")
+    rfp_text: Optional[str] = None
+    extra_tests: Optional[List[str]] = None
+
+
+# ===== APP =====
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    started = time.perf_counter()
+    agent: Optional[MainAgent] = None
+    pool: Executor
+    if USE_PROCESSES:
+        # Spawned, not forked: a forked worker would inherit the parent's
+        # agent without its watcher thread and never see a reload. Each
+        # worker builds its own agent and watcher in the initializer.
+        pool = ProcessPoolExecutor(max_workers=WORKERS, mp_context=multiprocessing.get_context("spawn"),
+                                   initializer=_warm_agent)
+        # Warm every worker before taking traffic
+        await asyncio.gather(*(asyncio.get_running_loop().run_in_executor(pool, _warm_agent_ready)
+                               for _ in range(WORKERS)))
+    else:
+        agent = _warm_agent()
+        pool = ThreadPoolExecutor(max_workers=WORKERS, thread_name_prefix="rfp-worker")
+    app.state.agent = agent
+    app.state.pool = pool
+    log.info("✅ Ready in %.2fs (%d %s workers)", time.perf_counter() - started, WORKERS,
+             "process" if USE_PROCESSES else "thread")
+    try:
+        yield
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+        if agent is not None:
+            agent.close()
+
+
+app = FastAPI(title="RFP Agentic AI System", lifespan=lifespan)
+
+
+async def _run(func, *args):
+    """Run CPU-bound work in the worker pool; a failure there is logged and returned as a 500"""
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(app.state.pool, func, *args)
+    except Exception:
+        log.exception("❌ %s failed", func.__name__.lstrip("_"))
+        raise HTTPException(status_code=500, detail="Internal error")
+
+
+@app.get("/health")
+async def health() -> Dict:
+    """Catalog served by the workers; with process workers, the oldest version any sampled worker serves"""
+    if USE_PROCESSES:
+        loop = asyncio.get_running_loop()
+        statuses = await asyncio.gather(*(loop.run_in_executor(app.state.pool, _catalog_status)
+                                          for _ in range(WORKERS)))
+    else:
+        statuses = [_catalog_status()]
+    oldest = min(statuses, key=lambda status: status["version"])
+    return {
+        "status": "ok",
+        "catalog_products": oldest["products"],
+        "catalog_version": oldest["version"],
+        "catalog_versions": sorted({status["version"] for status in statuses}),
+        "workers": WORKERS,
+        "worker_type": "process" if USE_PROCESSES else "thread",
+    }
+
+
+@app.get("/rfps")
+async def rfps() -> List[Dict]:
+    """RFPs ranked by strategic fit"""
+    return await _run(_ranked_rfps)
+
+
+@app.post("/match")
+async def match(request: MatchRequest) -> Dict:
+    """Top catalog matches for explicit line items or for the scope found in rfp_text"""
+    if not request.products and not request.rfp_text:
+        raise HTTPException(status_code=422, detail="Provide products or rfp_text")
+    products = [item.model_dump(exclude_none=True) for item in request.products or []]
+    return await _run(_match, products, request.rfp_text, request.top_k)
+
+
+@app.post("/price")
+async def price(request: PriceRequest) -> Dict:
+    """Material and test costs for the selected SKUs"""
+    recommendations = {name: rec.model_dump() for name, rec in request.recommendations.items()}
+    return await _run(_price, recommendations, request.extra_tests)
+
+
+@app.post("/proposal")
+async def proposal(request: ProposalRequest) -> Dict:
+    """Full technical + pricing response for one RFP"""
+    response = await _run(_proposal, request.rfp, request.rfp_id, request.rfp_text, request.extra_tests)
+    if response is None:
+        raise HTTPException(status_code=404, detail=f"Unknown RFP id: {request.rfp_id}")
+    return response
+
+
+@app.get("/proposals/{rfp_id:path}")
+async def stored_proposal(rfp_id: str, generated_at: Optional[str] = None) -> Dict:
+    """A past /proposal response: the latest for the RFP, or the one generated at a given time"""
+    response = await _run(_stored_proposal, rfp_id, generated_at)
+    if response is None:
+        raise HTTPException(status_code=404, detail=f"No stored proposal for {rfp_id}")
+    return response
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(app, host=os.environ.get("HOST", "0.0.0.0"), port=int(os.environ.get("PORT", 8000)))
@@ -0,0 +1,61 @@
+# benchmarks/bench_catalog_load.py
+# Run from the project root: python benchmarks/bench_catalog_load.py
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+sys.path.append('.')
+
+from agents.pricing_agent import PricingAgent
+from benchmarks.generators import make_catalog
+from utils.agent_logging import set_quiet
+from utils.catalog_repository import CatalogRepository
+from utils.columnar_catalog import convert_csv
+from utils.spec_matcher import SpecMatcher
+
+def load_agents(catalog_path: str):
+    """What MainAgent does at startup: the same catalog feeds both agents"""
+    repository = CatalogRepository(catalog_path)
+    matcher = SpecMatcher(repository)
+    pricing = PricingAgent(repository, "data/pricing/test_prices.csv", auto_refresh=False)
+    return matcher, pricing
+
+
+def measure(catalog_path: str):
+    """Load time, then (in a separate run, since tracing slows it down) peak Python heap"""
+    start = time.perf_counter()
+    load_agents(catalog_path)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    load_agents(catalog_path)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark catalog loading from CSV vs the compiled columnar format")
+    parser.add_argument("--skus", type=int, nargs="+", default=[1_000, 50_000, 200_000])
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    set_quiet()
+    print(f"{'skus':>8} {'format':8} {'size MB':>8} {'load s':>8} {'py heap MB':>11}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_skus in args.skus:
+            csv_path = os.path.join(tmp, f"catalog_{n_skus}.csv")
+            make_catalog(csv_path, n_skus, args.seed)
+            start = time.perf_counter()
+            cols_path = convert_csv(csv_path)
+            convert_seconds = time.perf_counter() - start
+            for label, path in (("csv", csv_path), ("columnar", cols_path)):
+                elapsed, peak = measure(path)
+                size = os.path.getsize(path) / 1e6
+                print(f"{n_skus:8} {label:8} {size:8.1f} {elapsed:8.3f} {peak / 1e6:11.1f}")
+            print(f"{'':8} (convert: {convert_seconds:.3f}s)")
+
+
+if __name__ == "__main__":
+    main()
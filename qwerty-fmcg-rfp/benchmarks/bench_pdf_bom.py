@@ -0,0 +1,81 @@
+# benchmarks/bench_pdf_bom.py
+# Run from the project root: python benchmarks/bench_pdf_bom.py
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+from io import BytesIO
+sys.path.append('.')
+
+from reportlab.platypus import SimpleDocTemplate, Table
+
+from benchmarks.generators import make_pricing
+from utils.proposal_renderer import BOM_COL_WIDTHS, BOM_HEADER, ProposalRenderer, bom_rows_from_pricing, format_currency
+
+def make_response(n_lines: int):
+    return {
+        "rfp_id": f"BENCH/{n_lines}",
+        "project_name": f"Benchmark BOM ({n_lines} lines)",
+        "client_name": "Benchmark Client",
+        "due_date": "2025-12-31",
+        "strategic_fit_score": 75,
+        "pricing_summary": {"material_cost": 1e9, "test_cost": 80000, "grand_total": 1e9 + 80000},
+    }
+
+
+def render_chunked(renderer: ProposalRenderer, n_lines: int, seed: int) -> bytes:
+    rows = bom_rows_from_pricing(make_pricing(random.Random(seed), n_lines), font=renderer.font)
+    return renderer.render(make_response(n_lines), bom=rows)
+
+
+def render_single_table(renderer: ProposalRenderer, n_lines: int, seed: int) -> bytes:
+    """The old layout: one Table holding every BOM row"""
+    response = make_response(n_lines)
+    pricing = response["pricing_summary"]
+    rows = list(bom_rows_from_pricing(make_pricing(random.Random(seed), n_lines), font=renderer.font))
+    data = [BOM_HEADER] + rows + [
+        ['', '', '', 'Material Subtotal', format_currency(pricing["material_cost"]), ''],
+        ['', '', '', 'Testing & QA', format_currency(pricing["test_cost"]), ''],
+        ['', '', '', 'GRAND TOTAL', format_currency(pricing["grand_total"]), ''],
+    ]
+    target = BytesIO()
+    doc = SimpleDocTemplate(target, pagesize=renderer.pagesize, rightMargin=renderer.margin,
+                            leftMargin=renderer.margin, topMargin=renderer.margin, bottomMargin=renderer.margin)
+    doc.build([Table(data, colWidths=BOM_COL_WIDTHS, repeatRows=1, style=renderer.bom_table_style(len(rows)))])
+    return target.getvalue()
+
+
+def measure(render, renderer: ProposalRenderer, n_lines: int, seed: int):
+    """Wall time, then (in a separate run, since tracing slows it down) peak traced memory"""
+    start = time.perf_counter()
+    pdf = render(renderer, n_lines, seed)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    render(renderer, n_lines, seed)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak, pdf.count(b"/Type /Page\n"), len(pdf)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark proposal PDF rendering for large BOMs")
+    parser.add_argument("--lines", type=int, nargs="+", default=[100, 1000, 5000, 10000])
+    parser.add_argument("--single-max", type=int, default=5000,
+                        help="largest BOM to also render as one table (the old layout)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    renderer = ProposalRenderer()
+    print(f"{'lines':>6} {'layout':8} {'seconds':>8} {'lines/s':>9} {'peak MB':>8} {'pages':>6} {'PDF MB':>7}")
+    for n_lines in args.lines:
+        layouts = [("chunked", render_chunked)]
+        if n_lines <= args.single_max:
+            layouts.append(("single", render_single_table))
+        for label, render in layouts:
+            elapsed, peak, pages, size = measure(render, renderer, n_lines, args.seed)
+            print(f"{n_lines:6} {label:8} {elapsed:8.2f} {n_lines / elapsed:9,.0f} {peak / 1e6:8.1f} {pages:6} {size / 1e6:7.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+# benchmarks/bench_scope_extractor.py
+# Run from the project root: python benchmarks/bench_scope_extractor.py
+import argparse
+import random
+import statistics
+import sys
+import time
+sys.path.append('.')
+
+from benchmarks.generators import make_tender
+from utils.rfp_segmenter import segment_sections
+from utils.scope_extractor import extract_line_items
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark RFP line-item extraction")
+    parser.add_argument("--tenders", type=int, default=50)
+    parser.add_argument("--items", type=int, nargs="+", default=[3, 50, 300, 500])
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"{'format':8} {'items':>6} {'lines':>6} {'p50 ms':>8} {'p95 ms':>8} {'items/s':>10}")
+    for boq in (False, True):
+        for n_items in args.items:
+            corpus = [make_tender(rng, n_items, boq) for _ in range(args.tenders)]
+            timings = []
+            for text in corpus:
+                start = time.perf_counter()
+                scope = extract_line_items(text, segment_sections(text))
+                timings.append(time.perf_counter() - start)
+                assert len(scope) == n_items, f"expected {n_items} items, got {len(scope)}"
+            timings.sort()
+            p50 = statistics.median(timings) * 1000
+            p95 = timings[int(0.95 * (len(timings) - 1))] * 1000
+            lines = corpus[0].count("\n")
+            print(f"{'boq' if boq else 'blocks':8} {n_items:6} {lines:6} {p50:8.2f} {p95:8.2f} {n_items / statistics.median(timings):10,.0f}")
+
+
+if __name__ == "__main__":
+    main()
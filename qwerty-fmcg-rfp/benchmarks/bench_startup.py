@@ -0,0 +1,100 @@
+# benchmarks/bench_startup.py
+# Run from the project root: python benchmarks/bench_startup.py
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Tuple
+sys.path.append('.')
+
+from benchmarks.generators import make_scope
+
+# Modules that dominate import time; each CLI command should load only its own
+HEAVY_MODULES = ["pandas", "numpy", "requests", "bs4", "pdfplumber", "reportlab"]
+IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def startup_commands(tmp: str, seed: int = 42) -> Dict[str, List[str]]:
+    """Interpreter arguments per command, with small inputs written to tmp
+
+    "python" is the bare interpreter, for reference: everything above it is
+    the cost of our own imports and work.
+    """
+    products_path = os.path.join(tmp, "products.json")
+    match_path = os.path.join(tmp, "match.json")
+    price_path = os.path.join(tmp, "price.json")
+    response_path = os.path.join(tmp, "response.json")
+    with open(products_path, "w") as f:
+        json.dump(make_scope(10, seed), f)
+    subprocess.run([sys.executable, "cli.py", "-q", "match", "--products", products_path, "-o", match_path], check=True)
+    subprocess.run([sys.executable, "cli.py", "-q", "price", match_path, "-o", price_path], check=True)
+    with open(match_path) as f:
+        technical = json.load(f)
+    with open(price_path) as f:
+        pricing = json.load(f)
+    with open(response_path, "w") as f:
+        json.dump({
+            "rfp_id": "BENCH/STARTUP", "project_name": "Startup benchmark", "client_name": "Benchmark Client",
+            "due_date": "2025-12-31", "strategic_fit_score": 75,
+            "technical_recommendations": technical["recommendations"],
+            "pricing_summary": {key: pricing[key] for key in ("material_cost", "test_cost", "grand_total")},
+        }, f)
+    return {
+        "python": ["-c", "pass"],
+        "scan": ["cli.py", "-q", "scan"],
+        "match": ["cli.py", "-q", "match", "--products", products_path],
+        "price": ["cli.py", "-q", "price", match_path],
+        "render": ["cli.py", "-q", "render", "--response", response_path, "-o", os.path.join(tmp, "proposal.pdf")],
+    }
+
+
+def run_once(argv: List[str]) -> float:
+    """Wall seconds for one fresh interpreter running argv"""
+    start = time.perf_counter()
+    subprocess.run([sys.executable, *argv], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+    return time.perf_counter() - start
+
+
+def import_profile(argv: List[str]) -> Tuple[float, List[Tuple[str, float]], List[str]]:
+    """Total import seconds, the costliest top-level imports and the heavy modules loaded (-X importtime)"""
+    result = subprocess.run([sys.executable, "-X", "importtime", *argv], stdout=subprocess.DEVNULL,
+                            stderr=subprocess.PIPE, text=True, check=True)
+    top_level = []
+    loaded = set()
+    for line in result.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if not match:
+            continue
+        cumulative_us, indent, name = int(match.group(2)), match.group(3), match.group(4)
+        loaded.add(name.split(".")[0])
+        if len(indent) == 1:
+            top_level.append((name, cumulative_us / 1e6))
+    total = sum(seconds for _, seconds in top_level)
+    top_level.sort(key=lambda item: item[1], reverse=True)
+    return total, top_level, [name for name in HEAVY_MODULES if name in loaded]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cold start and import cost of each CLI command")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--top", type=int, default=3, help="costliest top-level imports to list per command")
+    args = parser.parse_args()
+
+    print(f"{'command':8} {'p50 ms':>8} {'p95 ms':>8} {'import ms':>10}  heavy modules / costliest imports")
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, argv in startup_commands(tmp).items():
+            timings = sorted(run_once(argv) for _ in range(args.runs))
+            p50 = statistics.median(timings) * 1000
+            p95 = timings[int(0.95 * (len(timings) - 1))] * 1000
+            total, top_level, heavy = import_profile(argv)
+            costliest = ", ".join(f"{module} {seconds * 1000:.0f}" for module, seconds in top_level[:args.top])
+            print(f"{name:8} {p50:8.1f} {p95:8.1f} {total * 1000:10.1f}  [{', '.join(heavy) or '-'}] {costliest}")
+
+
+if __name__ == "__main__":
+    main()
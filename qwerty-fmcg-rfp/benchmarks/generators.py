@@ -0,0 +1,194 @@
+# benchmarks/generators.py
+# Seeded synthetic inputs shared by the benchmarks: the same seed always gives the same data
+import random
+from datetime import date, timedelta
+from typing import Dict, Iterator, List
+
+import numpy as np
+import pandas as pd
+
+VOLTAGES = [0.4, 0.6, 1.1, 3.3, 11]
+SIZES = [10, 16, 25, 35, 50, 70, 95, 120, 150, 185, 240, 300]
+CORES = [1, 2, 3, 3.5, 4]
+MATERIALS = ["Copper", "Aluminum", "Cu", "Aluminium"]
+INSULATIONS = ["XLPE (Cross-Linked Polyethylene)", "PVC", "XLPE"]
+ARMOURS = ["Steel tape", "Steel wire", "None"]
+CLIENTS = ["National Highway Authority of India", "Power Grid Corporation", "Indian Railways", "GeM Portal",
+           "State Electricity Board", "Metro Rail Corporation", "Municipal Corporation", "Private EPC Contractor"]
+PROJECTS = ["Highway Electrification", "Substation Cabling", "Metro Depot Wiring", "Street Lighting",
+            "Solar Park Evacuation", "Railway Electrification", "Smart City Ducting", "Industrial Plant Power"]
+PORTALS = ["NHAI", "PGCIL", "IREPS", "GEMP", "CPPP"]
+
+
+# ===== CATALOG =====
+
+def make_catalog_frame(n_skus: int, seed: int) -> pd.DataFrame:
+    """Synthetic catalog with the same columns as data/products/product_catalog.csv"""
+    rng = np.random.default_rng(seed)
+    voltage = rng.choice([0.4, 0.6, 1.1, 3.3, 11.0], n_skus)
+    size = rng.choice(SIZES, n_skus)
+    copper = rng.random(n_skus) < 0.5
+    xlpe = rng.random(n_skus) < 0.7
+    cores = rng.choice([1.0, 2.0, 3.0, 3.5, 4.0], n_skus)
+    sku = (
+        pd.Series(voltage).map("CABLE-{:g}KV-".format)
+        + pd.Series(size).astype(str) + np.where(copper, "CU-", "AL-") + np.where(xlpe, "XLPE-", "PVC-")
+        + pd.Series(cores).map("{:g}C-".format) + pd.Series(np.arange(n_skus)).map("{:07d}".format)
+    )
+    return pd.DataFrame({
+        "product_sku": sku,
+        "voltage_rating_kv": voltage,
+        "conductor_size_mm2": size,
+        "material": np.where(copper, "Copper", "Aluminum"),
+        "insulation_type": np.where(xlpe, "XLPE", "PVC"),
+        "core_count": cores,
+        "armoring": rng.choice(["Steel Tape", "Steel Wire", "None"], n_skus),
+        "temperature_rating_celsius": rng.choice([70, 90], n_skus),
+        "unit_price_per_meter": rng.integers(50, 2000, n_skus),
+        "bis_certified": rng.choice(["Yes", "No"], n_skus),
+        "lead_time_days": rng.choice([15, 30, 45], n_skus),
+        "warranty_years": rng.choice([1, 2, 5], n_skus),
+    })
+
+
+def make_catalog(path: str, n_skus: int, seed: int):
+    """Write a synthetic catalog CSV"""
+    make_catalog_frame(n_skus, seed).to_csv(path, index=False)
+
+
+# ===== RFP SCOPES =====
+
+def make_scope(n_lines: int, seed: int) -> List[Dict]:
+    """Line items as utils.scope_extractor returns them"""
+    rng = random.Random(seed)
+    scope = []
+    for i in range(n_lines):
+        voltage, size = rng.choice(VOLTAGES), rng.choice(SIZES)
+        scope.append({
+            "product_name": f"{voltage:g}kV Cable {size}mm² (Item {i + 1})",
+            "voltage_rating": float(voltage),
+            "conductor_size": float(size),
+            "material": rng.choice(["Copper", "Aluminum"]),
+            "insulation_type": rng.choice(["XLPE", "PVC"]),
+            "core_count": float(rng.choice(CORES)),
+            "armoring": rng.choice(["Steel Tape", "Steel Wire", "None"]),
+            "quantity": rng.randint(1, 40) * 50,
+        })
+    return scope
+
+
+def make_pricing(rng: random.Random, n_lines: int) -> Iterator[Dict]:
+    """Seeded stand-in for PricingAgent.execute()['detailed_pricing'] with n_lines products"""
+    for i in range(n_lines):
+        voltage, size = rng.choice(VOLTAGES), rng.choice(SIZES)
+        quantity = rng.randint(1, 40) * 50
+        unit_price = rng.randint(50, 900)
+        yield {
+            "product": f"{voltage}kV Cable {size}mm² (Item {i + 1})",
+            "sku": f"CABLE-{voltage}KV-{size}CU-XLPE-{rng.choice([2, 3, 4])}C",
+            "quantity": quantity,
+            "unit_price": unit_price,
+            "material_cost": unit_price * quantity,
+        }
+
+
+# ===== TENDER TEXT =====
+
+def make_block_item(rng: random.Random, n: int) -> str:
+    """An "Item N" block like data/rfps/Sample_RFPs.md"""
+    voltage = rng.choice(VOLTAGES)
+    quantity = rng.choice([f"{rng.randint(1, 40) * 50} meters", f"{rng.randint(1, 9) / 2} km", f"{rng.randint(1, 20) * 100:,} m"])
+    return (
+        f"**Item {n}: Power Cables ({voltage}kV)**\n"
+        f"- Quantity: {quantity}\n"
+        f"- Conductor Size: {rng.choice(SIZES)} {rng.choice(['mm²', 'sq.mm', 'mm2'])}\n"
+        f"- Material: {rng.choice(MATERIALS)}\n"
+        f"- Insulation Type: {rng.choice(INSULATIONS)}\n"
+        f"- Core Count: {rng.choice(CORES)} cores\n"
+        f"- Armoring: {rng.choice(ARMOURS)}\n"
+        f"- Rated Voltage: {voltage} kV\n"
+        f"- Temperature Rating: {rng.choice([70, 90])}°C\n"
+    )
+
+
+def make_boq_item(rng: random.Random, n: int) -> str:
+    """A one-line BOQ entry"""
+    return (
+        f"Item {n}: {rng.choice(VOLTAGES)}kV {rng.choice(CORES)}C {rng.choice(SIZES)} sq.mm "
+        f"{rng.choice(['Cu', 'Al'])} {rng.choice(['XLPE', 'PVC'])} {rng.choice(['steel wire armoured', 'unarmoured'])} "
+        f"cable - {rng.randint(1, 40) * 50} m\n"
+    )
+
+
+def make_tender(rng: random.Random, n_items: int, boq: bool) -> str:
+    make_item = make_boq_item if boq else make_block_item
+    items = "\n".join(make_item(rng, i + 1) for i in range(n_items))
+    return (
+        "# REQUEST FOR PROPOSAL\n\n## 1. PROJECT OVERVIEW\n\nSupply of cables.\n\n"
+        f"## 2. {'BILL OF QUANTITIES' if boq else 'SCOPE OF SUPPLY'}\n\n{items}\n"
+        "## 3. TECHNICAL SPECIFICATIONS\n\n- Standard: IS 1554\n\n"
+        "## 4. ACCEPTANCE & TEST REQUIREMENTS\n\n- High Voltage Withstand Test: ₹25,000\n"
+    )
+
+
+# ===== TENDER FEEDS =====
+
+def make_tender_feed(n_rfps: int, seed: int, duplicate_rate: float = 0.1) -> List[Dict]:
+    """RFP records as the Sales Agent parses them from portals
+
+    About duplicate_rate of them repeat an earlier tender under another
+    portal's id, as when one tender is listed on several portals.
+    """
+    rng = random.Random(seed)
+    today = date.today()
+    feed = []
+    for i in range(n_rfps):
+        if feed and rng.random() < duplicate_rate:
+            original = rng.choice(feed)
+            feed.append({**original, "id": f"{rng.choice(PORTALS)}/{original['id'].split('/', 1)[1]}"})
+            continue
+        voltage, size = rng.choice(VOLTAGES), rng.choice(SIZES)
+        due_date = today + timedelta(days=rng.randint(-10, 120))
+        feed.append({
+            "id": f"{rng.choice(PORTALS)}/{2025 + i % 2}/{i:07d}",
+            "title": f"{rng.choice(PROJECTS)} Package {i}",
+            "client": rng.choice(CLIENTS),
+            "due_date": due_date.isoformat() if rng.random() > 0.05 else "TBD",
+            "products": [f"{voltage}kV Cable {size}mm² {rng.randint(1, 40) * 50}m"],
+            "value": f"₹{rng.choice([2, 5, 8, 12, 15, 25])} Cr",
+            "keywords": rng.sample(["cable", "1.1kV", "0.6kV", "XLPE", "copper", "electrification",
+                                    "railway", "lighting", "substation"], 3),
+        })
+    return feed
+
+
+# ===== TENDER PDFS =====
+
+def make_tender_pdf(path: str, n_pages: int, seed: int, n_items: int = 50):
+    """A text-layer tender PDF: the scope of supply, then general conditions filling n_pages"""
+    from reportlab.lib.pagesizes import A4
+    from reportlab.pdfgen.canvas import Canvas
+
+    rng = random.Random(seed)
+    # Helvetica has no rupee sign
+    lines = make_tender(rng, n_items, boq=False).replace("₹", "Rs. ").splitlines()
+    lines += ["", "## 5. GENERAL CONDITIONS OF CONTRACT", ""]
+    width, height = A4
+    line_height, margin = 12, 50
+    lines_per_page = int((height - 2 * margin) // line_height)
+    clause = 1
+    while len(lines) < n_pages * lines_per_page:
+        lines.append(f"Clause {clause}: The contractor shall {rng.choice(['supply', 'test', 'deliver', 'install'])} "
+                     f"all cables within {rng.randint(2, 52)} weeks as per IS {rng.choice([694, 1554, 7098])}.")
+        clause += 1
+
+    canvas = Canvas(path, pagesize=A4)
+    canvas.setFont("Helvetica", 9)
+    for page in range(n_pages):
+        y = height - margin
+        for line in lines[page * lines_per_page:(page + 1) * lines_per_page]:
+            canvas.drawString(margin, y, line)
+            y -= line_height
+        canvas.showPage()
+        canvas.setFont("Helvetica", 9)
+    canvas.save()
@@ -0,0 +1,263 @@
+# benchmarks/run_benchmarks.py
+# Run from the project root: python benchmarks/run_benchmarks.py [--profile full] [--save-baseline]
+import argparse
+import itertools
+import json
+import logging
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional
+sys.path.append('.')
+
+import numpy as np
+
+from agents.pricing_agent import PricingAgent
+from agents.sales_agent import SalesAgent
+from agents.technical_agent import TechnicalAgent
+from benchmarks.bench_startup import run_once, startup_commands
+from benchmarks.generators import make_catalog, make_pricing, make_scope, make_tender_feed, make_tender_pdf
+from utils.agent_logging import configure_logging
+from utils.catalog_repository import CatalogRepository
+from utils.pdf_parser import parse_rfp_document
+from utils.proposal_renderer import ProposalRenderer, bom_rows_from_pricing
+
+DEFAULT_BASELINE = "benchmarks/baseline.json"
+TEST_PRICES_CSV = "data/pricing/test_prices.csv"
+
+# Sizes per profile. "quick" runs in about a minute; "full" goes up to the
+# largest catalogs, scopes and documents the system is expected to handle.
+PROFILES = {
+    "quick": {"catalog_skus": [1_000, 100_000], "scope_lines": [1, 100, 1000], "feed_rfps": [1_000, 100_000],
+              "pdf_pages": [20], "repeat": 5},
+    "full": {"catalog_skus": [1_000, 100_000, 1_000_000], "scope_lines": [1, 10, 100, 1000],
+             "feed_rfps": [1_000, 100_000, 1_000_000], "pdf_pages": [100, 300], "repeat": 10},
+}
+STAGES = ["catalog", "match", "pricing", "sales", "pdf_parse", "pdf_render", "startup"]
+
+# A case regresses when its median latency or peak memory grows by more than
+# the tolerance and by more than these absolute amounts (so tiny cases do
+# not flag on timer noise)
+MIN_LATENCY_DELTA_MS = 1.0
+MIN_MEMORY_DELTA_MB = 1.0
+
+
+class Case(NamedTuple):
+    """One measured stage at one input size"""
+    name: str
+    call: Callable[[], object]
+    items: int        # work items per call, for throughput
+    unit: str
+    calls: int        # timed calls
+
+
+# ===== MEASUREMENT =====
+
+def measure(case: Case) -> Dict:
+    """Latency percentiles and throughput over case.calls, then peak traced memory of one more call"""
+    latencies = []
+    for _ in range(case.calls):
+        start = time.perf_counter()
+        case.call()
+        latencies.append(time.perf_counter() - start)
+    # Tracing slows allocation-heavy code down, so memory gets its own call
+    tracemalloc.start()
+    case.call()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    latencies_ms = np.array(latencies) * 1000
+    p50, p95, p99 = np.percentile(latencies_ms, [50, 95, 99])
+    return {
+        "calls": case.calls,
+        "items_per_call": case.items,
+        "unit": case.unit,
+        "p50_ms": float(p50),
+        "p95_ms": float(p95),
+        "p99_ms": float(p99),
+        "mean_ms": float(latencies_ms.mean()),
+        "throughput_per_s": case.items / (latencies_ms.mean() / 1000),
+        "peak_memory_mb": peak / 1e6,
+    }
+
+
+# ===== CASES =====
+
+def catalog_cases(config: Dict, tmp: str, seed: int, stages: List[str]) -> Iterator[Case]:
+    """Catalog load, matching and pricing for every catalog size x scope size"""
+    repeat = config["repeat"]
+    for n_skus in config["catalog_skus"]:
+        csv_path = os.path.join(tmp, f"catalog_{n_skus}.csv")
+        make_catalog(csv_path, n_skus, seed)
+
+        def load(path=csv_path):
+            # Both lazy indexes are built by the first request in production
+            repository = CatalogRepository(path)
+            repository.sku_index
+            repository.spec_index
+            return repository
+
+        if "catalog" in stages:
+            yield Case(f"catalog.load[skus={n_skus}]", load, n_skus, "SKUs", max(1, repeat // 2))
+        if "match" not in stages and "pricing" not in stages:
+            continue
+
+        repository = load()
+        technical_agent = TechnicalAgent(repository)
+        pricing_agent = PricingAgent(repository, TEST_PRICES_CSV, auto_refresh=False)
+        if "match" in stages:
+            lines = itertools.cycle(make_scope(100, seed))
+            yield Case(f"matcher.find_top_matches[skus={n_skus}]",
+                       lambda: technical_agent.matcher.find_top_matches(next(lines)), 1, "lines", repeat * 20)
+        for n_lines in config["scope_lines"]:
+            scope = make_scope(n_lines, seed)
+            if "match" in stages:
+                yield Case(f"technical.match_scope[skus={n_skus},lines={n_lines}]",
+                           lambda scope=scope: technical_agent.match_scope(scope), n_lines, "lines", repeat)
+            if "pricing" in stages:
+                technical = technical_agent.match_scope(scope)
+                yield Case(f"pricing.execute[skus={n_skus},lines={n_lines}]",
+                           lambda technical=technical: pricing_agent.execute(technical), n_lines, "lines", repeat)
+
+
+def sales_cases(config: Dict, seed: int) -> Iterator[Case]:
+    sales_agent = SalesAgent()
+    for n_rfps in config["feed_rfps"]:
+        feed = make_tender_feed(n_rfps, seed)
+        yield Case(f"sales.rank[rfps={n_rfps}]", lambda feed=feed: sales_agent._rank_by_strategic_fit(feed),
+                   n_rfps, "RFPs", config["repeat"])
+
+
+def pdf_parse_cases(config: Dict, tmp: str, seed: int) -> Iterator[Case]:
+    for n_pages in config["pdf_pages"]:
+        pdf_path = os.path.join(tmp, f"tender_{n_pages}.pdf")
+        make_tender_pdf(pdf_path, n_pages, seed)
+        yield Case(f"pdf_parser.parse_document[pages={n_pages}]", lambda path=pdf_path: parse_rfp_document(path),
+                   n_pages, "pages", max(1, config["repeat"] // 5))
+
+
+def pdf_render_cases(config: Dict, seed: int) -> Iterator[Case]:
+    renderer = ProposalRenderer()
+    for n_lines in config["scope_lines"]:
+        pricing = {"material_cost": 1e9, "test_cost": 80000, "grand_total": 1e9 + 80000}
+        response = {"rfp_id": f"BENCH/{n_lines}", "project_name": f"Benchmark BOM ({n_lines} lines)",
+                    "client_name": "Benchmark Client", "due_date": "2025-12-31", "strategic_fit_score": 75,
+                    "pricing_summary": pricing}
+
+        def render(response=response, n_lines=n_lines):
+            rows = bom_rows_from_pricing(make_pricing(random.Random(seed), n_lines), font=renderer.font)
+            return renderer.render(response, bom=rows)
+
+        yield Case(f"pdf.render[lines={n_lines}]", render, n_lines, "lines", max(1, config["repeat"] // 2))
+
+
+def startup_cases(config: Dict, tmp: str, seed: int) -> Iterator[Case]:
+    """Cold start of each CLI command in a fresh interpreter (benchmarks/bench_startup.py breaks it down)"""
+    for command, argv in startup_commands(tmp, seed).items():
+        yield Case(f"startup[cmd={command}]", lambda argv=argv: run_once(argv), 1, "starts", config["repeat"] * 2)
+
+
+def iter_cases(config: Dict, tmp: str, seed: int, stages: List[str]) -> Iterator[Case]:
+    """Cases are generated lazily, so only one catalog's data is held at a time"""
+    if {"catalog", "match", "pricing"} & set(stages):
+        yield from catalog_cases(config, tmp, seed, stages)
+    if "sales" in stages:
+        yield from sales_cases(config, seed)
+    if "pdf_parse" in stages:
+        yield from pdf_parse_cases(config, tmp, seed)
+    if "pdf_render" in stages:
+        yield from pdf_render_cases(config, seed)
+    if "startup" in stages:
+        yield from startup_cases(config, tmp, seed)
+
+
+# ===== BASELINE =====
+
+def compare(result: Dict, baseline: Optional[Dict], tolerance: float) -> str:
+    """'' without a baseline entry, else the change in p50 and peak memory, flagged on regression"""
+    if not baseline:
+        return ""
+    latency_delta = result["p50_ms"] - baseline["p50_ms"]
+    memory_delta = result["peak_memory_mb"] - baseline["peak_memory_mb"]
+    slower = latency_delta > MIN_LATENCY_DELTA_MS and result["p50_ms"] > baseline["p50_ms"] * (1 + tolerance)
+    bigger = memory_delta > MIN_MEMORY_DELTA_MB and result["peak_memory_mb"] > baseline["peak_memory_mb"] * (1 + tolerance)
+    change = (f"{latency_delta / baseline['p50_ms']:+.0%} time" if baseline["p50_ms"] else "")
+    if baseline["peak_memory_mb"]:
+        change += f", {memory_delta / baseline['peak_memory_mb']:+.0%} mem"
+    flags = [flag for flag, hit in (("SLOWER", slower), ("MORE MEMORY", bigger)) if hit]
+    return change + (f"  ❌ {' + '.join(flags)}" if flags else "")
+
+
+def load_baseline(path: str) -> Dict[str, Dict]:
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)["results"]
+
+
+def save_report(path: str, results: Dict[str, Dict], profile: str, seed: int):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    report = {
+        "meta": {"profile": profile, "seed": seed, "python": platform.python_version(),
+                 "platform": platform.platform(), "cpus": os.cpu_count(), "created_at": datetime.now().isoformat()},
+        "results": results,
+    }
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark every pipeline stage on seeded synthetic data")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="quick")
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=STAGES)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="results to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed fractional slowdown / memory growth")
+    parser.add_argument("--save-baseline", action="store_true", help="store this run as the new baseline")
+    parser.add_argument("--output", help="also write this run's results as JSON")
+    parser.add_argument("--check", action="store_true", help="exit with status 1 if any case regressed")
+    args = parser.parse_args()
+
+    # Agents' progress banners would interleave with the table
+    configure_logging(level=logging.WARNING)
+    config = PROFILES[args.profile]
+    baseline = load_baseline(args.baseline)
+    results: Dict[str, Dict] = {}
+    regressions = []
+
+    print(f"Profile: {args.profile}  seed: {args.seed}  baseline: {args.baseline if baseline else 'none'}")
+    print(f"{'case':48} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'throughput':>16} {'peak MB':>8}  vs baseline")
+    with tempfile.TemporaryDirectory() as tmp:
+        for case in iter_cases(config, tmp, args.seed, args.stages):
+            result = results[case.name] = measure(case)
+            verdict = compare(result, baseline.get(case.name), args.tolerance)
+            if "❌" in verdict:
+                regressions.append(case.name)
+            throughput = f"{result['throughput_per_s']:,.0f} {case.unit}/s"
+            print(f"{case.name:48} {result['p50_ms']:9.2f} {result['p95_ms']:9.2f} {result['p99_ms']:9.2f} "
+                  f"{throughput:>16} {result['peak_memory_mb']:8.1f}  {verdict}", flush=True)
+
+    if args.output:
+        save_report(args.output, results, args.profile, args.seed)
+    if args.save_baseline:
+        # Cases not in this run keep their stored numbers
+        save_report(args.baseline, {**baseline, **results}, args.profile, args.seed)
+        print(f"📌 Baseline saved to: {args.baseline}")
+    if regressions:
+        print(f"❌ {len(regressions)} regression(s) beyond {args.tolerance:.0%}: {', '.join(regressions)}")
+        if args.check:
+            return 1
+    elif baseline:
+        print(f"✅ No regressions beyond {args.tolerance:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,160 @@
+# cli.py - command-line entry point
+# Run from the project root: python cli.py {scan,match,price,render} --help
+import argparse
+import json
+import logging
+import sys
+from contextlib import redirect_stdout
+from typing import Dict
+
+from utils.agent_logging import configure_logging
+
+# Each command imports the agents it needs inside its handler, so `scan`
+# never loads pandas, `match` and `price` never load reportlab or requests,
+# and only `render` loads reportlab.
+
+CATALOG_CSV = "data/products/product_catalog.csv"
+TEST_PRICES_CSV = "data/pricing/test_prices.csv"
+
+
+def _read_json(path: str):
+    """JSON from a file, or from stdin for '-'"""
+    if path == "-":
+        return json.load(sys.stdin)
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def _write_json(data, args):
+    """JSON to args.output, or to stdout when no path is given"""
+    from utils.result_store import json_default
+
+    text = json.dumps(data, indent=2, ensure_ascii=False, default=json_default)
+    if args.output is None:
+        args.stdout.write(text + "\n")
+    else:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+
+
+# ===== COMMANDS =====
+
+def scan(args) -> int:
+    """Rank RFPs from the portals"""
+    from agents.sales_agent import SalesAgent
+
+    ranked = SalesAgent().scan_portals(live=args.live, incremental=args.incremental)
+    if args.top:
+        ranked = ranked[:args.top]
+    if args.json:
+        _write_json(ranked, args)
+        return 0
+    for rfp in ranked:
+        args.stdout.write(f"{rfp['fit_score']:5.0f}%  {rfp['status']:10}  {rfp['id']:20}  {rfp['title']}\n")
+    return 0
+
+
+def match(args) -> int:
+    """Match line items (a products JSON list, or the scope found in an RFP text/PDF) to catalog SKUs"""
+    from agents.technical_agent import TechnicalAgent
+
+    agent = TechnicalAgent(args.catalog)
+    if args.products:
+        result = agent.match_scope(_read_json(args.products), top_k=args.top_k)
+    elif args.rfp.lower().endswith(".pdf"):
+        from utils.pdf_parser import parse_rfp_document
+        from utils.rfp_segmenter import Section
+
+        document = parse_rfp_document(args.rfp)
+        sections = [Section(*s) for s in document["sections"]]
+        result = agent.match_scope(agent.extract_scope_from_rfp(document["text"], sections), top_k=args.top_k)
+    else:
+        with open(args.rfp, "r") as f:
+            result = agent.match_scope(agent.extract_scope_from_rfp(f.read()), top_k=args.top_k)
+    if not args.tables:
+        result.pop("comparison_tables")
+    _write_json(result, args)
+    return 0
+
+
+def price(args) -> int:
+    """Material and test costs for the SKUs selected by `match`"""
+    from agents.pricing_agent import PricingAgent
+
+    technical: Dict = _read_json(args.match)
+    agent = PricingAgent(args.catalog, args.test_prices, auto_refresh=False)
+    _write_json(agent.execute(technical, args.extra_tests), args)
+    return 0
+
+
+def render(args) -> int:
+    """Proposal PDF for a response JSON file or a stored response (latest by default)"""
+    from utils.proposal_renderer import ProposalRenderer, proposal_filename
+
+    if args.response:
+        response = _read_json(args.response)
+    else:
+        from utils.result_store import ResultStore
+
+        store = ResultStore()
+        response = store.get(args.rfp_id) if args.rfp_id else store.latest()
+        if response is None:
+            sys.stderr.write(f"No saved response{' for ' + args.rfp_id if args.rfp_id else ''} in {store.path}\n")
+            return 1
+    output = args.output or proposal_filename(response)
+    ProposalRenderer().render(response, output)
+    sys.stderr.write(f"✓ {output}\n")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="RFP agent pipeline, one stage at a time")
+    parser.add_argument("-q", "--quiet", action="store_true", help="only log warnings and errors")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    scan_parser = commands.add_parser("scan", help=scan.__doc__)
+    scan_parser.add_argument("--live", action="store_true", help="fetch the portals in data/urls.txt")
+    scan_parser.add_argument("--incremental", action="store_true", help="with --live, only rank new or changed RFPs")
+    scan_parser.add_argument("--top", type=int, help="show only the N best")
+    scan_parser.add_argument("--json", action="store_true", help="print the ranked RFP records as JSON")
+    scan_parser.add_argument("-o", "--output", help="with --json, write to this file")
+    scan_parser.set_defaults(handler=scan)
+
+    match_parser = commands.add_parser("match", help=match.__doc__)
+    source = match_parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--products", help="JSON list of line-item specs ('-' for stdin)")
+    source.add_argument("--rfp", help="RFP document (.pdf, or text/markdown)")
+    match_parser.add_argument("--top-k", type=int, default=3)
+    match_parser.add_argument("--catalog", default=CATALOG_CSV, help="catalog CSV or compiled .cols file")
+    match_parser.add_argument("--tables", action="store_true", help="include the text comparison tables")
+    match_parser.add_argument("-o", "--output", help="write JSON here instead of stdout")
+    match_parser.set_defaults(handler=match)
+
+    price_parser = commands.add_parser("price", help=price.__doc__)
+    price_parser.add_argument("match", help="JSON written by `match` ('-' for stdin)")
+    price_parser.add_argument("--extra-tests", nargs="+")
+    price_parser.add_argument("--catalog", default=CATALOG_CSV, help="price table (catalog CSV or .cols file)")
+    price_parser.add_argument("--test-prices", default=TEST_PRICES_CSV)
+    price_parser.add_argument("-o", "--output", help="write JSON here instead of stdout")
+    price_parser.set_defaults(handler=price)
+
+    render_parser = commands.add_parser("render", help=render.__doc__)
+    source = render_parser.add_mutually_exclusive_group()
+    source.add_argument("--response", help="consolidated response JSON ('-' for stdin)")
+    source.add_argument("--rfp-id", help="latest stored response for this RFP")
+    render_parser.add_argument("-o", "--output", help="PDF path (default: <rfp id>_proposal.pdf)")
+    render_parser.set_defaults(handler=render)
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    # stdout carries the command's output, so agent logs and prints go to stderr
+    configure_logging(level=logging.WARNING if args.quiet else None, stream=sys.stderr)
+    args.stdout = sys.stdout
+    with redirect_stdout(sys.stderr):
+        return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+from utils.pdf_parser import _split_lines, iter_pdf_pages, parse_rfp_scope, parse_test_requirements
+
+TENDER = (
+    "Request for Proposal\n"
+    "Scope of Supply\n"
+    "1.1kV cable 240 sq.mm\n"
+    "Technical Specifications\n"
+    "IS 1554\n"
+    "Test Requirements\n"
+    "High voltage test\n"
+    "Pricing\n"
+    "Rs. 25,000\n"
+)
+
+
+def test_split_lines_matches_str_split():
+    for text in ["", "a", "a\n", "\n\nb\nc", "x\ny\n\n"]:
+        assert list(_split_lines(text)) == text.split("\n")
+
+
+def test_parsers_on_a_string():
+    assert parse_rfp_scope(TENDER) == "scope of supply\n1.1kv cable 240 sq.mm\ntechnical specifications"
+    assert parse_test_requirements(TENDER) == "test requirements\nhigh voltage test\npricing"
+
+
+class PageStream:
+    """Stand-in for iter_pdf_pages(): yields page texts and records how many were read and whether it was closed"""
+
+    def __init__(self, pages):
+        self._pages = iter(pages)
+        self.read = 0
+        self.closed = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        page = next(self._pages)
+        self.read += 1
+        return page
+
+    def close(self):
+        self.closed = True
+
+
+def test_scope_parser_stops_reading_pages_after_its_section():
+    pages = PageStream(["Scope of Supply\n1.1kV cable", "Technical Specifications\nIS 1554", "later page", "last page"])
+    assert parse_rfp_scope(pages) == "scope of supply\n1.1kv cable\ntechnical specifications"
+    assert pages.read == 2
+    assert pages.closed
+
+
+def test_test_parser_stops_reading_pages_after_its_section():
+    pages = PageStream(["Overview", "Test Requirements\nHigh voltage test", "Cost schedule", "annexures"])
+    assert parse_test_requirements(pages) == "test requirements\nhigh voltage test\ncost schedule"
+    assert pages.read == 3
+    assert pages.closed
+
+
+def test_parsers_on_a_page_stream_match_the_joined_text():
+    lines = TENDER.splitlines()
+    pages = ["\n".join(lines[:3]), "\n".join(lines[3:])]
+    assert parse_rfp_scope(PageStream(pages)) == parse_rfp_scope(TENDER)
+    assert parse_test_requirements(PageStream(pages)) == parse_test_requirements(TENDER)
+
+
+def test_parsers_on_iter_pdf_pages(tmp_path):
+    from reportlab.lib.pagesizes import A4
+    from reportlab.pdfgen.canvas import Canvas
+
+    path = str(tmp_path / "tender.pdf")
+    canvas = Canvas(path, pagesize=A4)
+    lines = TENDER.splitlines()
+    for page in (lines[:3], lines[3:]):
+        for i, line in enumerate(page):
+            canvas.drawString(50, 780 - 14 * i, line)
+        canvas.showPage()
+    canvas.save()
+
+    assert parse_rfp_scope(iter_pdf_pages(path)) == parse_rfp_scope(TENDER)
+    assert parse_test_requirements(iter_pdf_pages(path)) == parse_test_requirements(TENDER)
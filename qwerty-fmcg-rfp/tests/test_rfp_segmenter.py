@@ -0,0 +1,49 @@
+from utils.rfp_segmenter import segment_sections
+from utils.scope_extractor import extract_line_items
+
+TENDER = """## 2. SCOPE OF SUPPLY
+
+**Item 1: Power Cables (1.1kV)**
+- Quantity: 1000 meters
+- Delivery Period: 60 days
+- Acceptance Tests: as per IS 7098
+- Conductor Size: 240 sq.mm
+- Material: Copper
+
+**Item 2: Power Cables (0.6kV)**
+- Quantity: 500 meters
+- Conductor Size: 185 sq.mm
+
+## 3. TECHNICAL SPECIFICATIONS
+- Standard: IS 1554
+"""
+
+
+def headings(text):
+    return [(section.name, text[section.start:section.body_start].strip()) for section in segment_sections(text)]
+
+
+def test_bulleted_fields_inside_a_section_are_not_headings():
+    assert headings(TENDER) == [("scope", "## 2. SCOPE OF SUPPLY"), ("technical", "## 3. TECHNICAL SPECIFICATIONS")]
+
+
+def test_line_items_with_sections_match_a_full_scan():
+    items = extract_line_items(TENDER, segment_sections(TENDER))
+    assert items == extract_line_items(TENDER)
+    assert [(item["product_name"], item.get("conductor_size"), item.get("material")) for item in items] == [
+        ("1.1kV Cable 240mm²", 240.0, "Copper"),
+        ("0.6kV Cable 185mm²", 185.0, None),
+    ]
+
+
+def test_heading_forms():
+    text = "\n".join([
+        "SCOPE OF SUPPLY",
+        "**Technical Specifications**",
+        "4.1 Test requirements",
+        "### Bill of Quantities",
+        "ACCEPTANCE TESTS: AS PER IS 7098",
+        "- Delivery Period: 60 days",
+        "Pricing of spares is included",
+    ])
+    assert [name for name, _ in headings(text)] == ["scope", "technical", "tests", "boq"]
@@ -0,0 +1,91 @@
+import json
+import logging
+import os
+import sys
+from typing import Optional, TextIO
+
+LOGGER_NAME = "rfp"
+
+# Per-item messages (each product, match and price line) are DEBUG; stage
+# banners and summaries are INFO. Quiet mode raises the level to INFO, and
+# callers guard per-item loops with isEnabledFor so no formatting happens.
+ITEM = logging.DEBUG
+
+
+class AgentFormatter(logging.Formatter):
+    """'[Agent Name] message', keeping any leading blank line before the prefix"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = record.getMessage()
+        stripped = message.lstrip("\n")
+        newlines = "\n" * (len(message) - len(stripped))
+        agent = getattr(record, "agent", None)
+        if record.exc_info:
+            stripped += "\n" + self.formatException(record.exc_info)
+        return f"{newlines}[{agent}] {stripped}" if agent else f"{newlines}{stripped}"
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line with the agent and any structured fields"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": round(record.created, 3),
+            "level": record.levelname,
+            "agent": getattr(record, "agent", None),
+            "msg": record.getMessage().strip(),
+        }
+        entry.update(getattr(record, "data", None) or {})
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class AgentLogger(logging.LoggerAdapter):
+    """Adds the agent name to every record, keeping any extra= passed per call"""
+
+    def process(self, msg, kwargs):
+        kwargs["extra"] = {**self.extra, **(kwargs.get("extra") or {})}
+        return msg, kwargs
+
+
+def configure_logging(level: Optional[int] = None, json_format: Optional[bool] = None,
+                      stream: Optional[TextIO] = None, quiet: Optional[bool] = None):
+    """(Re)configure the 'rfp' logger; defaults come from RFP_LOG_LEVEL, RFP_LOG_FORMAT and RFP_QUIET"""
+    if level is None:
+        level = logging.getLevelName(os.environ.get("RFP_LOG_LEVEL", "DEBUG").upper())
+        if not isinstance(level, int):
+            level = ITEM
+    if quiet is None:
+        quiet = bool(os.environ.get("RFP_QUIET"))
+    if quiet:
+        level = max(level, logging.INFO)
+    if json_format is None:
+        json_format = os.environ.get("RFP_LOG_FORMAT", "").lower() == "json"
+
+    logger = logging.getLogger(LOGGER_NAME)
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    handler = logging.StreamHandler(stream or sys.stdout)
+    handler.setFormatter(JsonFormatter() if json_format else AgentFormatter())
+    logger.addHandler(handler)
+    logger.setLevel(level)
+    logger.propagate = False
+    return logger
+
+
+def set_quiet(quiet: bool = True):
+    """Skip per-item messages (and their formatting) entirely"""
+    logger = logging.getLogger(LOGGER_NAME)
+    if not logger.handlers:
+        configure_logging()
+    logger.setLevel(logging.INFO if quiet else ITEM)
+
+
+def get_logger(agent: str) -> AgentLogger:
+    """Logger whose records carry the agent name"""
+    logger = logging.getLogger(LOGGER_NAME)
+    if not logger.handlers:
+        configure_logging()
+    child = logging.getLogger(f"{LOGGER_NAME}.{agent.lower().replace(' ', '_')}")
+    return AgentLogger(child, {"agent": agent})
@@ -0,0 +1,124 @@
+import os
+import sys
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from utils.agent_logging import get_logger
+from utils.columnar_catalog import read_catalog
+from utils.instrumentation import instrument
+
+# Catalog columns compared as strings for the mandatory score, in the same
+# order (and with the same float coercion) as SpecMatcher.calculate_exact_match
+MANDATORY_COLUMNS = [
+    ("voltage_rating", "voltage_rating_kv", True),
+    ("conductor_size", "conductor_size_mm2", True),
+    ("material", "material", False),
+    ("insulation_type", "insulation_type", False),
+]
+
+
+class SkuIndex(NamedTuple):
+    """Price-table row per SKU plus the columns pricing reads by position"""
+    positions: Dict[str, int]
+    unit_prices: np.ndarray
+    lead_times: Optional[np.ndarray]
+
+
+class SpecIndex(NamedTuple):
+    """Catalog columns encoded for the vectorized matcher"""
+    mandatory_codes: List[np.ndarray]    # per MANDATORY_COLUMNS field, one code per row
+    mandatory_vocab: List[Dict[str, int]]  # lowercased value -> code
+    core_count: np.ndarray
+    cert_score: np.ndarray
+    buckets: Dict[Tuple, np.ndarray]     # all four mandatory codes -> rows
+
+
+class CatalogRepository:
+    """Loads each catalog source once and holds the indexes built on it
+
+    TechnicalAgent and PricingAgent are both given the same repository, so
+    when the product catalog doubles as the price table (the default) it is
+    read and indexed a single time.
+    """
+
+    @instrument("catalog_repository.load")
+    def __init__(self, catalog_path: str, product_prices_path: Optional[str] = None):
+        """Either path may be a CSV or a compiled catalog (utils.columnar_catalog)"""
+        self.catalog_path = catalog_path
+        self.product_prices_path = product_prices_path or catalog_path
+        self.catalog = read_catalog(catalog_path)
+        if os.path.abspath(self.product_prices_path) == os.path.abspath(catalog_path):
+            self.product_prices = self.catalog
+        else:
+            self.product_prices = read_catalog(self.product_prices_path)
+        self._sku_index: Optional[SkuIndex] = None
+        self._spec_index: Optional[SpecIndex] = None
+        get_logger("Catalog Repository").info("Loaded %d products from catalog", len(self.catalog))
+
+    @property
+    def sku_index(self) -> SkuIndex:
+        if self._sku_index is None:
+            self._sku_index = self._build_sku_index()
+        return self._sku_index
+
+    @property
+    def spec_index(self) -> SpecIndex:
+        if self._spec_index is None:
+            self._spec_index = self._build_spec_index()
+        return self._spec_index
+
+    def _build_sku_index(self) -> SkuIndex:
+        """Index unit price and lead time by SKU (first row wins, as with iloc[0])"""
+        prices = self.product_prices
+        skus = prices["product_sku"].tolist()
+        # Built back to front so the first occurrence of a SKU is the one kept
+        positions = dict(zip(reversed(skus), range(len(skus) - 1, -1, -1)))
+        unit_prices = prices["unit_price_per_meter"].to_numpy(dtype=float)
+        lead_times = prices["lead_time_days"].to_numpy() if "lead_time_days" in prices else None
+        return SkuIndex(positions, unit_prices, lead_times)
+
+    def _build_spec_index(self) -> SpecIndex:
+        """Dictionary-encode the mandatory fields and bucket rows by their codes"""
+        catalog = self.catalog
+        mandatory_codes = []
+        mandatory_vocab = []
+        for _, column, as_float in MANDATORY_COLUMNS:
+            values = catalog[column]
+            if as_float:
+                values = values.astype(float)
+            # Stringify distinct values only, then merge values that lowercase alike
+            value_codes, values = pd.factorize(values, use_na_sentinel=False)
+            key_codes, uniques = pd.factorize(np.array([str(v).lower() for v in values], dtype=object))
+            mandatory_codes.append(key_codes[value_codes])
+            mandatory_vocab.append({sys.intern(key): code for code, key in enumerate(uniques)})
+        core_count = catalog["core_count"].to_numpy(dtype=float)
+        cert_score = np.where(catalog["bis_certified"].to_numpy() == "Yes", 100.0, 70.0)
+        buckets = self._build_buckets(mandatory_codes, [len(vocab) for vocab in mandatory_vocab])
+        return SpecIndex(mandatory_codes, mandatory_vocab, core_count, cert_score, buckets)
+
+    def _build_buckets(self, mandatory_codes: List[np.ndarray], sizes: List[int]) -> Dict[Tuple, np.ndarray]:
+        """Group catalog rows into buckets keyed by all four mandatory field codes"""
+        buckets: Dict[Tuple, np.ndarray] = {}
+        if not len(self.catalog):
+            return buckets
+        # Pack the four codes into one integer so grouping is a 1-D sort
+        packed = np.zeros(len(self.catalog), dtype=np.int64)
+        for codes, size in zip(mandatory_codes, sizes):
+            packed = packed * size + codes
+        unique_keys, inverse = np.unique(packed, return_inverse=True)
+        order = np.argsort(inverse, kind="stable")
+        splits = np.cumsum(np.bincount(inverse))[:-1]
+        for key, rows in zip(unique_keys.tolist(), np.split(order, splits)):
+            codes = []
+            for size in reversed(sizes):
+                key, code = divmod(key, size)
+                codes.append(code)
+            buckets[tuple(reversed(codes))] = rows
+        return buckets
+
+    def row_by_sku(self, sku: str) -> Optional[pd.Series]:
+        """Price-table row for a SKU (None when unknown)"""
+        position = self.sku_index.positions.get(sku)
+        return self.product_prices.iloc[position] if position is not None else None
@@ -0,0 +1,107 @@
+import os
+import threading
+import time
+from typing import Any, Callable, List, NamedTuple, Optional, Tuple
+
+from utils.agent_logging import get_logger
+
+
+class CatalogSnapshot(NamedTuple):
+    """One immutable build of the catalog tables"""
+    version: int
+    value: Any           # whatever build() returned (e.g. the agents holding the tables)
+    loaded_at: float     # time.time() when the build finished
+    signature: Tuple     # (path, mtime_ns, size) per watched file
+
+
+class CatalogWatcher:
+    """Rebuilds tables in the background when their source files change
+
+    Readers take `current` once per call and use only that snapshot, so a
+    swap never changes tables under an in-flight call. A new snapshot is
+    built off to the side and published with a single reference assignment.
+    """
+
+    def __init__(self, paths: List[str], build: Callable[[], Any], interval: float = 2.0):
+        self.paths = list(paths)
+        self.build = build
+        self.interval = interval
+        self.log = get_logger("Catalog Watcher")
+        self._build_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._pending: Optional[Tuple] = None
+        self._failed: Optional[Tuple] = None
+        signature = self._signature()
+        self._snapshot = CatalogSnapshot(1, build(), time.time(), signature)
+
+    @property
+    def current(self) -> CatalogSnapshot:
+        return self._snapshot
+
+    @property
+    def version(self) -> int:
+        return self._snapshot.version
+
+    def _signature(self) -> Tuple:
+        signature = []
+        for path in dict.fromkeys(self.paths):
+            try:
+                stat = os.stat(path)
+                signature.append((path, stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                signature.append((path, None, None))
+        return tuple(signature)
+
+    def check(self, force: bool = False) -> bool:
+        """Rebuild if the files changed; True when a new snapshot was published
+
+        A change is only picked up once the files look the same on two
+        consecutive checks, so a CSV still being written is not loaded.
+        """
+        signature = self._signature()
+        if not force:
+            if signature == self._snapshot.signature or signature == self._failed:
+                self._pending = None
+                return False
+            if signature != self._pending:
+                self._pending = signature
+                return False
+        return self.reload(signature)
+
+    def reload(self, signature: Optional[Tuple] = None) -> bool:
+        """Build a new snapshot now and swap it in (the old one stays live on failure)"""
+        with self._build_lock:
+            signature = signature or self._signature()
+            started = time.perf_counter()
+            try:
+                value = self.build()
+            except Exception as e:
+                self._failed = signature
+                self.log.warning("⚠️ Reload failed, keeping version %d: %s", self._snapshot.version, e)
+                return False
+            self._snapshot = CatalogSnapshot(self._snapshot.version + 1, value, time.time(), signature)
+            self._pending = self._failed = None
+        self.log.info("🔄 Catalog version %d loaded in %.2fs", self._snapshot.version, time.perf_counter() - started)
+        return True
+
+    def start(self):
+        """Poll the files every `interval` seconds on a daemon thread"""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="catalog-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception as e:
+                self.log.warning("⚠️ Watcher check failed: %s", e)
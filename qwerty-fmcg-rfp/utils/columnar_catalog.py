@@ -0,0 +1,191 @@
+# utils/columnar_catalog.py
+# Convert from the project root: python -m utils.columnar_catalog data/products/product_catalog.csv
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# File layout: MAGIC, little-endian uint64 header length, JSON header, then
+# one 64-byte aligned array per numeric column and a (codes, vocab) pair per
+# categorical column. A vocab is its values as UTF-8 joined by NUL bytes.
+# Offsets in the header are from the start of the file.
+MAGIC = b"RFPCOLS1"
+FORMAT_VERSION = 1
+ALIGN = 64
+COLUMNAR_SUFFIX = ".cols"
+
+
+def default_output_path(csv_path: str) -> str:
+    """data/products/product_catalog.csv -> data/products/product_catalog.cols"""
+    return os.path.splitext(csv_path)[0] + COLUMNAR_SUFFIX
+
+
+def is_columnar(path: str) -> bool:
+    """True for a compiled catalog file (checked by magic, not by extension)"""
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except (IsADirectoryError, FileNotFoundError):
+        return False
+
+
+def _padding(position: int) -> int:
+    return -position % ALIGN
+
+
+def convert_csv(csv_path: str, output_path: Optional[str] = None) -> str:
+    """Compile a catalog CSV into the columnar format; returns the output path
+
+    Numeric columns keep the dtype pandas infers. Every other column is
+    dictionary-encoded (the narrowest signed int codes, -1 for missing, plus
+    a string vocabulary). The file is written next to the target and renamed
+    into place, so processes that have the old file mapped keep reading it.
+    """
+    output_path = output_path or default_output_path(csv_path)
+    frame = pd.read_csv(csv_path)
+
+    arrays: List[np.ndarray] = []
+    columns = []
+    for name in frame.columns:
+        values = frame[name]
+        if values.dtype.kind in "biuf":
+            array = np.ascontiguousarray(values.to_numpy())
+            columns.append({"name": name, "kind": "numeric", "dtype": array.dtype.str})
+            arrays.append(array)
+        else:
+            codes, uniques = pd.factorize(values)
+            codes = codes.astype(np.min_scalar_type(-len(uniques) - 1))
+            vocab = np.frombuffer("\0".join(str(value) for value in uniques).encode(), dtype=np.uint8)
+            columns.append({"name": name, "kind": "categorical", "dtype": codes.dtype.str,
+                            "vocab_size": len(uniques), "vocab_bytes": vocab.nbytes})
+            arrays.extend([codes, vocab])
+
+    # Lay out the header with placeholder offsets, then fill them in. Offsets
+    # are fixed-width so the header length does not change when they are set.
+    header = {"format": FORMAT_VERSION, "rows": len(frame), "source": os.path.basename(csv_path),
+              "columns": columns}
+    slots = [(column, key) for column in columns
+             for key in (("offset",) if column["kind"] == "numeric" else ("offset", "vocab_offset"))]
+    for column, key in slots:
+        column[key] = 0
+    header_size = len(json.dumps(header).encode()) + 20 * len(slots)
+    position = len(MAGIC) + 8 + header_size
+    for (column, key), array in zip(slots, arrays):
+        position += _padding(position)
+        column[key] = position
+        position += array.nbytes
+    header_bytes = json.dumps(header).encode().ljust(header_size)
+
+    directory = os.path.dirname(os.path.abspath(output_path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".catalog-", suffix=COLUMNAR_SUFFIX)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(MAGIC)
+            f.write(struct.pack("<Q", header_size))
+            f.write(header_bytes)
+            for array in arrays:
+                f.write(b"\0" * _padding(f.tell()))
+                f.write(array.tobytes())
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return output_path
+
+
+class ColumnarCatalog:
+    """A compiled catalog mapped read-only into memory
+
+    Arrays are views on one shared mapping, so every process that opens the
+    same file shares the pages through the OS page cache instead of holding
+    its own parsed copy.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mmap[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not a compiled catalog")
+        (header_size,) = struct.unpack_from("<Q", self._mmap, len(MAGIC))
+        start = len(MAGIC) + 8
+        self.header = json.loads(bytes(self._mmap[start:start + header_size]))
+        if self.header["format"] != FORMAT_VERSION:
+            raise ValueError(f"{path}: unsupported catalog format {self.header['format']}")
+        self.rows: int = self.header["rows"]
+        self._columns: Dict[str, Dict] = {column["name"]: column for column in self.header["columns"]}
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._columns
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._columns)
+
+    def _view(self, dtype: str, offset: int, count: int) -> np.ndarray:
+        return np.frombuffer(self._mmap, dtype=np.dtype(dtype), count=count, offset=offset)
+
+    def is_categorical(self, name: str) -> bool:
+        return self._columns[name]["kind"] == "categorical"
+
+    def numeric(self, name: str) -> np.ndarray:
+        """Read-only typed array for a numeric column"""
+        column = self._columns[name]
+        return self._view(column["dtype"], column["offset"], self.rows)
+
+    def codes(self, name: str) -> np.ndarray:
+        """Read-only codes for a categorical column (-1 = missing)"""
+        column = self._columns[name]
+        return self._view(column["dtype"], column["offset"], self.rows)
+
+    def vocab(self, name: str) -> List[str]:
+        """Distinct values of a categorical column, indexed by code"""
+        column = self._columns[name]
+        if not column["vocab_size"]:
+            return []
+        start = column["vocab_offset"]
+        return self._mmap[start:start + column["vocab_bytes"]].decode().split("\0")
+
+    def column(self, name: str):
+        """Numeric array or pandas Categorical for one column"""
+        if not self.is_categorical(name):
+            return self.numeric(name)
+        return pd.Categorical.from_codes(self.codes(name), categories=self.vocab(name), validate=False)
+
+    def to_frame(self) -> pd.DataFrame:
+        """DataFrame over the mapped arrays; categorical columns use pandas' category dtype"""
+        return pd.DataFrame({name: self.column(name) for name in self._columns}, copy=False)
+
+
+def read_catalog(path: str) -> pd.DataFrame:
+    """Catalog table from either a compiled catalog or a CSV"""
+    if is_columnar(path):
+        return ColumnarCatalog(path).to_frame()
+    return pd.read_csv(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile a catalog CSV into the memory-mapped columnar format")
+    parser.add_argument("csv_path")
+    parser.add_argument("-o", "--output", help=f"output file (default: CSV path with {COLUMNAR_SUFFIX})")
+    args = parser.parse_args()
+
+    output_path = convert_csv(args.csv_path, args.output)
+    catalog = ColumnarCatalog(output_path)
+    size = os.path.getsize(output_path)
+    print(f"✓ {args.csv_path} -> {output_path} ({len(catalog)} rows, {len(catalog.columns)} columns, {size:,} bytes)")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+import hashlib
+import json
+import os
+from typing import Dict, Optional
+
+
+def file_hash(path: str, chunk_size: int = 1 << 20) -> str:
+    """SHA-256 of a file's bytes, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class DocumentCache:
+    """Content-addressed on-disk cache of parsed RFP documents
+
+    Entries are JSON files named by the SHA-256 of the source PDF, so a
+    re-downloaded but unchanged tender hits the cache. When the total size
+    passes max_bytes the least recently used entries are evicted.
+    """
+
+    def __init__(self, cache_dir: str = "data/cache/documents", max_bytes: int = 256 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(cache_dir, exist_ok=True)
+
+        # Recency is tracked with file mtimes so it survives restarts
+        self._sizes: Dict[str, int] = {}
+        for name in os.listdir(cache_dir):
+            if name.endswith(".json"):
+                self._sizes[name[:-5]] = os.path.getsize(os.path.join(cache_dir, name))
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _last_used(self, key: str) -> float:
+        try:
+            return os.path.getmtime(self._path(key))
+        except OSError:
+            return 0.0
+
+    def get(self, key: str) -> Optional[Dict]:
+        path = self._path(key)
+        try:
+            with open(path, "r") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        os.utime(path)
+        self.hits += 1
+        return entry
+
+    def put(self, key: str, entry: Dict):
+        path = self._path(key)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, path)
+        self._sizes[key] = os.path.getsize(path)
+        self._evict()
+
+    def _evict(self):
+        total = sum(self._sizes.values())
+        if total <= self.max_bytes:
+            return
+        by_age = sorted(self._sizes, key=self._last_used)
+        # Never evict the newest entry, even if it alone exceeds the budget
+        for key in by_age[:-1]:
+            if total <= self.max_bytes:
+                break
+            total -= self._sizes.pop(key)
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+
+    def stats(self) -> Dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._sizes),
+            "bytes": sum(self._sizes.values()),
+        }
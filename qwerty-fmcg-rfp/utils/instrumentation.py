@@ -0,0 +1,169 @@
+import cProfile
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+
+class StageMetrics:
+    """Accumulated timings for one pipeline stage"""
+
+    __slots__ = ("calls", "wall_seconds", "cpu_seconds", "max_wall_seconds", "peak_memory_bytes")
+
+    def __init__(self):
+        self.calls = 0
+        self.wall_seconds = 0.0
+        self.cpu_seconds = 0.0
+        self.max_wall_seconds = 0.0
+        self.peak_memory_bytes = 0
+
+    def to_dict(self) -> Dict:
+        return {
+            "calls": self.calls,
+            "wall_seconds": self.wall_seconds,
+            "cpu_seconds": self.cpu_seconds,
+            "max_wall_seconds": self.max_wall_seconds,
+            "mean_wall_seconds": self.wall_seconds / self.calls if self.calls else 0.0,
+            "peak_memory_bytes": self.peak_memory_bytes,
+        }
+
+
+class Metrics:
+    """Process-wide stage metrics; recording is a single flag check when disabled"""
+
+    def __init__(self):
+        self.enabled = False
+        self.trace_memory = False
+        self.stages: Dict[str, StageMetrics] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def enable(self, trace_memory: bool = False):
+        """Start recording; trace_memory adds per-stage peak memory via tracemalloc"""
+        self.enabled = True
+        self.trace_memory = trace_memory
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def disable(self):
+        self.enabled = False
+        if self.trace_memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self.trace_memory = False
+
+    def reset(self):
+        with self._lock:
+            self.stages = {}
+
+    def record(self, name: str, wall: float, cpu: float, peak_memory: int = 0):
+        with self._lock:
+            stage_metrics = self.stages.get(name)
+            if stage_metrics is None:
+                stage_metrics = self.stages[name] = StageMetrics()
+            stage_metrics.calls += 1
+            stage_metrics.wall_seconds += wall
+            stage_metrics.cpu_seconds += cpu
+            stage_metrics.max_wall_seconds = max(stage_metrics.max_wall_seconds, wall)
+            stage_metrics.peak_memory_bytes = max(stage_metrics.peak_memory_bytes, peak_memory)
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time a block of code as a named stage"""
+        if not self.enabled:
+            yield
+            return
+        trace_memory = self.trace_memory and tracemalloc.is_tracing()
+        if trace_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            # Resetting the peak for this stage must not lose it for enclosing stages
+            frames = self._local.__dict__.setdefault("frames", [])
+            for frame in frames:
+                frame[1] = max(frame[1], peak)
+            tracemalloc.reset_peak()
+            frame = [current, current]
+            frames.append(frame)
+        wall, cpu = time.perf_counter(), time.thread_time()
+        try:
+            yield
+        finally:
+            wall, cpu = time.perf_counter() - wall, time.thread_time() - cpu
+            peak_memory = 0
+            if trace_memory:
+                peak = tracemalloc.get_traced_memory()[1]
+                frames.pop()
+                for outer in frames:
+                    outer[1] = max(outer[1], peak)
+                peak_memory = max(frame[1], peak) - frame[0]
+            self.record(name, wall, cpu, peak_memory)
+
+    def snapshot(self) -> Dict[str, Dict]:
+        with self._lock:
+            return {name: stage_metrics.to_dict() for name, stage_metrics in sorted(self.stages.items())}
+
+    def to_json(self) -> str:
+        return json.dumps({"stages": self.snapshot()}, indent=2)
+
+    def to_prometheus(self, prefix: str = "rfp_stage") -> str:
+        """Prometheus text exposition format, one series per stage"""
+        snapshot = self.snapshot()
+        series = [
+            ("calls_total", "counter", "Number of calls", "calls"),
+            ("wall_seconds_total", "counter", "Wall-clock seconds spent", "wall_seconds"),
+            ("cpu_seconds_total", "counter", "Thread CPU seconds spent", "cpu_seconds"),
+            ("max_wall_seconds", "gauge", "Slowest single call in seconds", "max_wall_seconds"),
+            ("peak_memory_bytes", "gauge", "Peak traced memory above the stage's start", "peak_memory_bytes"),
+        ]
+        lines = []
+        for suffix, kind, help_text, key in series:
+            metric = f"{prefix}_{suffix}"
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} {kind}")
+            for name, values in snapshot.items():
+                lines.append(f'{metric}{{stage="{name}"}} {values[key]}')
+        return "\n".join(lines) + "\n"
+
+    def save(self, path: str):
+        """Write metrics as JSON, or Prometheus text when the path ends in .prom"""
+        with open(path, "w") as f:
+            f.write(self.to_prometheus() if path.endswith(".prom") else self.to_json())
+
+    @contextmanager
+    def session(self, profile_path: Optional[str] = None, trace_memory: bool = False):
+        """Record one run; optionally cProfile it into profile_path"""
+        self.reset()
+        self.enable(trace_memory=trace_memory)
+        profiler = cProfile.Profile() if profile_path else None
+        if profiler:
+            profiler.enable()
+        try:
+            yield self
+        finally:
+            if profiler:
+                profiler.disable()
+                profiler.dump_stats(profile_path)
+            self.disable()
+
+
+metrics = Metrics()
+if os.environ.get("RFP_METRICS"):
+    metrics.enable(trace_memory=os.environ.get("RFP_METRICS") == "memory")
+
+
+def instrument(name: str):
+    """Decorator recording a function's calls as a stage"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not metrics.enabled:
+                return func(*args, **kwargs)
+            with metrics.stage(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+stage = metrics.stage
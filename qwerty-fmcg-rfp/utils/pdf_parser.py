@@ -1,37 +1,174 @@
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from contextlib import closing
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
 import pdfplumber
 
+from utils.document_cache import DocumentCache, file_hash
+from utils.instrumentation import instrument
+from utils.rfp_segmenter import section_text, sections_by_name, segment_sections
+
+def _page_texts(pages) -> Iterator[str]:
+    for page in pages:
+        # extract_text() returns None for pages without a text layer
+        yield page.extract_text() or ""
+        page.close()
+
+def iter_pdf_pages(pdf_path, start: int = 0, stop: Optional[int] = None) -> Iterator[str]:
+    """Yield the text of each page in [start, stop) in order (to the last page when stop is None), holding one page at a time"""
+    # Restricting pdfplumber to the range avoids building Page objects outside
+    # it; a range also keeps its per-page membership test constant-time
+    pages = None if start == 0 and stop is None else range(start + 1, sys.maxsize if stop is None else stop + 1)
+    with pdfplumber.open(pdf_path, pages=pages) as pdf:
+        yield from _page_texts(pdf.pages)
+
+@instrument("pdf_parser.extract_text")
 def extract_text_from_pdf(pdf_path):
-    text = ""
+    return "".join(page_text + "\n" for page_text in iter_pdf_pages(pdf_path))
+
+def count_pdf_pages(pdf_path) -> int:
     with pdfplumber.open(pdf_path) as pdf:
-        for page in pdf.pages:
-            text += page.extract_text() + "\n"
-    return text
+        return len(pdf.pages)
+
+def _extract_page_range(pdf_path, start: int, stop: int,
+                        count: bool = False) -> Tuple[List[str], Optional[int], float, float]:
+    """Worker: page texts for [start, stop), the document's page count (with count=True, else None)
+    and the wall and CPU seconds spent"""
+    wall, cpu = time.perf_counter(), time.process_time()
+    if count:
+        # Page objects are cheap next to text extraction, so the first chunk opens them all to count
+        with pdfplumber.open(pdf_path) as pdf:
+            texts = list(_page_texts(pdf.pages[start:stop]))
+            n_pages = len(pdf.pages)
+    else:
+        texts, n_pages = list(iter_pdf_pages(pdf_path, start, stop)), None
+    return texts, n_pages, time.perf_counter() - wall, time.process_time() - cpu
+
+@instrument("pdf_parser.extract_batch")
+def extract_texts_from_pdfs(pdf_paths: List[str], max_workers: Optional[int] = None,
+                            pages_per_chunk: int = 25) -> List[Dict]:
+    """Extract many PDFs on a process pool, splitting large documents into page ranges
+
+    Returns one record per input path (in input order) with the text
+    reassembled in page order and per-document timing: extraction wall and
+    CPU seconds summed over its chunks, and when it completed in the batch.
+    Each document's first chunk also counts its pages, and the rest of its
+    chunks are queued when that comes back.
+    """
+    results = [
+        {"path": path, "text": "", "pages": 0,
+         "extract_seconds": 0.0, "cpu_seconds": 0.0, "completed_after_seconds": 0.0}
+        for path in pdf_paths
+    ]
+    chunks: Dict[int, List[Optional[List[str]]]] = {}
+    began = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+        pending = {}
+        for doc, result in enumerate(results):
+            future = pool.submit(_extract_page_range, result["path"], 0, pages_per_chunk, True)
+            pending[future] = (doc, 0)
+        remaining = {doc: 1 for doc in range(len(results))}
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                doc, chunk = pending.pop(future)
+                texts, n_pages, wall_seconds, cpu_seconds = future.result()
+                result = results[doc]
+                if n_pages is not None:
+                    result["pages"] = n_pages
+                    starts = range(0, n_pages, pages_per_chunk)
+                    chunks[doc] = [None] * max(1, len(starts))
+                    for next_chunk, start in enumerate(starts[1:], 1):
+                        next_future = pool.submit(_extract_page_range, result["path"], start, start + pages_per_chunk)
+                        pending[next_future] = (doc, next_chunk)
+                    remaining[doc] += len(chunks[doc]) - 1
+                chunks[doc][chunk] = texts
+                result["extract_seconds"] += wall_seconds
+                result["cpu_seconds"] += cpu_seconds
+                remaining[doc] -= 1
+                if remaining[doc] == 0:
+                    result["completed_after_seconds"] = time.perf_counter() - began
+
+    for doc, result in enumerate(results):
+        result["text"] = "".join(text + "\n" for texts in chunks[doc] for text in texts)
+    return results
+
+def _split_lines(text: str) -> Iterator[str]:
+    """Lines of text one at a time, so a caller that stops early never splits the rest"""
+    start = 0
+    end = text.find("\n")
+    while end != -1:
+        yield text[start:end]
+        start = end + 1
+        end = text.find("\n", start)
+    yield text[start:]
+
+def _iter_lines(source: Union[str, Iterable[str]]) -> Iterator[str]:
+    """Lines of a document given as one string or as a stream of page texts"""
+    pages = [source] if isinstance(source, str) else source
+    try:
+        for page_text in pages:
+            yield from _split_lines(page_text)
+    finally:
+        # Stop the page stream (and close the PDF) as soon as the caller is done
+        if hasattr(pages, "close"):
+            pages.close()
 
 def parse_rfp_scope(text):
     # Simple heuristic: look for "Scope of Supply", "Quantity", "Description"
-    lines = text.split("\n")
+    # text may be a string or a page stream such as iter_pdf_pages(path)
     scope_lines = []
     in_scope = False
-    for line in lines:
-        line = line.strip().lower()
-        if "scope of supply" in line or "quantity" in line:
-            in_scope = True
-        if in_scope and line:
-            scope_lines.append(line)
-        if "technical specifications" in line or "test requirements" in line:
-            break
+    with closing(_iter_lines(text)) as lines:
+        for line in lines:
+            line = line.strip().lower()
+            if "scope of supply" in line or "quantity" in line:
+                in_scope = True
+            if in_scope and line:
+                scope_lines.append(line)
+            if "technical specifications" in line or "test requirements" in line:
+                break
     return "\n".join(scope_lines)
 
 def parse_test_requirements(text):
-    lines = text.split("\n")
     test_lines = []
     in_tests = False
-    for line in lines:
-        line = line.strip().lower()
-        if "test requirements" in line or "acceptance tests" in line:
-            in_tests = True
-        if in_tests and line:
-            test_lines.append(line)
-        if "pricing" in line or "cost" in line:
-            break
+    with closing(_iter_lines(text)) as lines:
+        for line in lines:
+            line = line.strip().lower()
+            if "test requirements" in line or "acceptance tests" in line:
+                in_tests = True
+            if in_tests and line:
+                test_lines.append(line)
+            if "pricing" in line or "cost" in line:
+                break
     return "\n".join(test_lines)
+
+@instrument("pdf_parser.parse_document")
+def parse_rfp_document(pdf_path, cache: Optional[DocumentCache] = None) -> Dict:
+    """Extracted text, section offsets and the scope and test section texts, reused from cache for unchanged files"""
+    key = file_hash(pdf_path) if cache is not None else None
+    if cache is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+    text = extract_text_from_pdf(pdf_path)
+    # One segmentation pass; the scope and test texts are slices of it
+    sections = segment_sections(text)
+    grouped = sections_by_name(sections)
+    scope = sorted(grouped.get("scope", []) + grouped.get("boq", []), key=lambda s: s.start)
+    document = {
+        "text": text,
+        "scope": "\n".join(section_text(text, s) for s in scope),
+        "tests": "\n".join(section_text(text, s) for s in grouped.get("tests", [])),
+        "sections": [list(section) for section in sections],
+    }
+    if cache is not None:
+        cache.put(key, document)
+    return document
@@ -0,0 +1,87 @@
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from typing import List, Dict, Optional
+
+from utils.agent_logging import get_logger
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class PortalCache:
+    """On-disk LRU cache of each portal URL's validators and parsed RFP records"""
+
+    def __init__(self, path: str = "data/cache/portal_cache.json", max_entries: int = 500):
+        self.path = path
+        self.max_entries = max_entries
+        self.entries: "OrderedDict[str, Dict]" = OrderedDict()
+        self.log = get_logger("Portal Cache")
+        self.load()
+
+    def load(self):
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, "r") as f:
+                    self.entries = OrderedDict(json.load(f))
+            except (OSError, ValueError) as e:
+                self.log.warning("⚠️ Ignoring unreadable cache %s: %s", self.path, e)
+                self.entries = OrderedDict()
+
+    def save(self):
+        """Write the cache atomically so a crashed run never leaves a torn file"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.entries, f)
+        os.replace(tmp_path, self.path)
+
+    def get(self, url: str) -> Optional[Dict]:
+        entry = self.entries.get(url)
+        if entry is not None:
+            self.entries.move_to_end(url)
+        return entry
+
+    def conditional_headers(self, url: str) -> Dict:
+        """If-None-Match / If-Modified-Since headers for a cached URL"""
+        entry = self.entries.get(url)
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def is_unchanged(self, url: str, page_hash: str) -> bool:
+        entry = self.get(url)
+        return entry is not None and entry.get("content_hash") == page_hash
+
+    def refresh_validators(self, url: str, headers: Dict):
+        """Record new ETag/Last-Modified values for a page whose content is unchanged"""
+        entry = self.get(url)
+        if entry is not None:
+            entry["etag"] = headers.get("etag", entry.get("etag"))
+            entry["last_modified"] = headers.get("last-modified", entry.get("last_modified"))
+
+    def update(self, url: str, headers: Dict, page_hash: str, rfps: List[Dict]) -> List[Dict]:
+        """Store a freshly parsed page and return only its new or changed RFPs"""
+        previous = self.entries.get(url, {}).get("rfps", [])
+        previous_by_id = {rfp["id"]: rfp for rfp in previous}
+        changed = [rfp for rfp in rfps if previous_by_id.get(rfp["id"]) != rfp]
+
+        self.entries[url] = {
+            "etag": headers.get("etag"),
+            "last_modified": headers.get("last-modified"),
+            "content_hash": page_hash,
+            "rfps": rfps,
+        }
+        self.entries.move_to_end(url)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+        return changed
@@ -0,0 +1,208 @@
+import asyncio
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import List, Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+
+from utils.agent_logging import get_logger
+from utils.portal_cache import PortalCache, content_hash
+
+# Status codes worth retrying: rate limiting and transient server errors
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Header words used to map tender table columns onto RFP fields
+COLUMN_ALIASES = {
+    "id": ["ref", "tender id", "tender no", "bid no", "nit no", "id"],
+    "title": ["title", "description", "name of work", "work", "subject"],
+    "client": ["organisation", "organization", "department", "client", "buyer"],
+    "due_date": ["closing", "due", "end date", "last date", "submission"],
+    "value": ["value", "estimated", "emd", "amount"],
+}
+
+URL_PATTERN = re.compile(r"https?://\S+")
+
+
+def extract_url(line: str) -> Optional[str]:
+    """Pull the URL out of a urls.txt entry like '1. GeM Tenders: https://...'"""
+    match = URL_PATTERN.search(line)
+    return match.group(0) if match else None
+
+
+def _map_columns(headers: List[str]) -> Dict[str, int]:
+    """Map RFP fields to table column positions by header text"""
+    columns = {}
+    for field, aliases in COLUMN_ALIASES.items():
+        for position, header in enumerate(headers):
+            if position not in columns.values() and any(alias in header for alias in aliases):
+                columns[field] = position
+                break
+    return columns
+
+
+def _cell(cells: List[str], columns: Dict[str, int], field: str, default: str) -> str:
+    position = columns.get(field)
+    return cells[position] if position is not None and position < len(cells) else default
+
+
+def parse_portal_page(url: str, html: str) -> List[Dict]:
+    """Parse tender listing tables on a portal page into RFP records"""
+    soup = BeautifulSoup(html, "html.parser")
+    rfps = []
+
+    for table in soup.find_all("table"):
+        rows = table.find_all("tr")
+        if len(rows) < 2:
+            continue
+        headers = [cell.get_text(" ", strip=True).lower() for cell in rows[0].find_all(["th", "td"])]
+        columns = _map_columns(headers)
+        if "title" not in columns:
+            continue
+
+        for row in rows[1:]:
+            cells = [cell.get_text(" ", strip=True) for cell in row.find_all(["td", "th"])]
+            if len(cells) <= columns["title"] or not cells[columns["title"]]:
+                continue
+            host = urlsplit(url).netloc
+            title = cells[columns["title"]]
+            rfps.append({
+                "id": _cell(cells, columns, "id", f"{host}/{len(rfps) + 1}"),
+                "title": title,
+                "client": _cell(cells, columns, "client", host),
+                "due_date": _cell(cells, columns, "due_date", "N/A"),
+                "products": [],
+                "value": _cell(cells, columns, "value", "N/A"),
+                "keywords": title.split(),
+                "source_url": url,
+            })
+
+    return rfps
+
+
+class PortalFetcher:
+    """Fetches portal pages concurrently over a shared pooled HTTP session"""
+
+    def __init__(self, timeout: float = 20.0, connect_timeout: float = 5.0,
+                 per_host_limit: int = 2, max_connections: int = 20,
+                 retries: int = 3, backoff: float = 0.5,
+                 parse_workers: Optional[int] = None, use_processes: bool = True):
+        self.name = "Portal Fetcher"
+        self.log = get_logger(self.name)
+        self.timeout = (connect_timeout, timeout)
+        self.per_host_limit = per_host_limit
+        self.max_connections = max_connections
+        self.retries = retries
+        self.backoff = backoff
+        self.parse_workers = parse_workers
+        self.use_processes = use_processes
+
+        # One session for every portal so TCP/TLS connections are reused
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_connections, pool_maxsize=per_host_limit)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers["User-Agent"] = "Mozilla/5.0 (RFP Sales Agent)"
+
+        self._io_pool = ThreadPoolExecutor(max_workers=max_connections)
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+        self._host_limits_loop = None
+
+    def _host_limit(self, url: str) -> asyncio.Semaphore:
+        """Per-host semaphore so no single portal gets more than per_host_limit requests"""
+        # Semaphores belong to one event loop; start fresh for each asyncio.run()
+        loop = asyncio.get_running_loop()
+        if loop is not self._host_limits_loop:
+            self._host_limits = {}
+            self._host_limits_loop = loop
+        host = urlsplit(url).netloc
+        if host not in self._host_limits:
+            self._host_limits[host] = asyncio.Semaphore(self.per_host_limit)
+        return self._host_limits[host]
+
+    def _get(self, url: str, headers: Optional[Dict] = None) -> requests.Response:
+        return self.session.get(url, headers=headers, timeout=self.timeout)
+
+    async def fetch(self, url: str, headers: Optional[Dict] = None) -> Dict:
+        """Fetch one URL with retry and exponential backoff"""
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        result = {"url": url, "status": None, "text": None, "headers": {}, "error": None, "attempts": 0}
+
+        async with self._host_limit(url):
+            for attempt in range(1, self.retries + 2):
+                result["attempts"] = attempt
+                try:
+                    response = await loop.run_in_executor(self._io_pool, self._get, url, headers)
+                    result["status"] = response.status_code
+                    result["error"] = None
+                    if response.status_code not in RETRY_STATUSES:
+                        result["text"] = response.text
+                        result["headers"] = {k.lower(): v for k, v in response.headers.items()}
+                        break
+                    result["error"] = f"HTTP {response.status_code}"
+                except requests.RequestException as e:
+                    result["error"] = str(e)
+                if attempt <= self.retries:
+                    await asyncio.sleep(self.backoff * 2 ** (attempt - 1))
+
+        result["elapsed"] = time.perf_counter() - start
+        return result
+
+    async def fetch_all(self, urls: List[str]) -> List[Dict]:
+        """Fetch all URLs concurrently, in input order"""
+        return await asyncio.gather(*(self.fetch(url) for url in urls))
+
+    async def scan(self, urls: List[str], cache: Optional[PortalCache] = None) -> List[Dict]:
+        """Fetch every portal and parse the pages into RFP records on a worker pool
+
+        With a cache, requests are conditional and only new or changed RFPs
+        are returned; 304s and pages with an unchanged hash are not re-parsed.
+        """
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(*(
+            self.fetch(url, cache.conditional_headers(url) if cache else None) for url in urls
+        ))
+
+        pages = []
+        for r in results:
+            if r["error"]:
+                self.log.warning("⚠️ %s: %s after %d attempt(s)", r["url"], r["error"], r["attempts"])
+            if cache is not None and r["status"] == 304:
+                cache.get(r["url"])
+                continue
+            if r["status"] != 200 or r["text"] is None:
+                continue
+            r["content_hash"] = content_hash(r["text"])
+            if cache is not None and cache.is_unchanged(r["url"], r["content_hash"]):
+                cache.refresh_validators(r["url"], r["headers"])
+                continue
+            pages.append(r)
+
+        parsed = []
+        if pages:
+            pool_class = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
+            with pool_class(max_workers=self.parse_workers) as pool:
+                parsed = await asyncio.gather(*(
+                    loop.run_in_executor(pool, parse_portal_page, page["url"], page["text"])
+                    for page in pages
+                ))
+
+        rfps = []
+        for page, page_rfps in zip(pages, parsed):
+            if cache is not None:
+                page_rfps = cache.update(page["url"], page["headers"], page["content_hash"], page_rfps)
+            rfps.extend(page_rfps)
+
+        if cache is not None:
+            cache.save()
+            self.log.info("♻️ %d/%d portals unchanged since last scan", len(urls) - len(pages), len(urls))
+
+        return rfps
+
+    def close(self):
+        self._io_pool.shutdown(wait=False)
+        self.session.close()
@@ -0,0 +1,478 @@
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from io import BytesIO
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.units import inch, mm
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.platypus import PageBreak, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
+from utils.instrumentation import instrument, stage
+
+DARK_BLUE = colors.HexColor('#1a3a52')
+MID_BLUE = colors.HexColor('#2c5f7f')
+LIGHT_BLUE = colors.HexColor('#e8f1f7')
+PALE_BLUE = colors.HexColor('#f5f9fc')
+GRID_BLUE = colors.HexColor('#c5d9e8')
+TEXT_GREY = colors.HexColor('#333333')
+
+BOM_HEADER = ['Product Description', 'SKU', 'Qty', 'Rate', 'Total', 'Match']
+BOM_COL_WIDTHS = [1.6*inch, 1.5*inch, 0.7*inch, 1*inch, 1.2*inch, 0.7*inch]
+BOM_FONT_SIZE = 9
+# Every BOM row is 12pt per text line plus 8pt top and bottom padding (the
+# style sets the leading, so the header and total rows obey it too)
+BOM_LEADING = 12
+BOM_PADDING = 16
+# Text width available in the description and SKU columns (after padding)
+DESCRIPTION_WIDTH = BOM_COL_WIDTHS[0] - 16
+SKU_WIDTH = BOM_COL_WIDTHS[1] - 10
+INFO_COL_WIDTHS = [2.3*inch, 4*inch]
+
+
+@lru_cache(maxsize=None)
+def register_fonts() -> Tuple[str, str]:
+    """(regular, bold) font names; DejaVu supports the rupee symbol, Helvetica is the fallback"""
+    try:
+        pdfmetrics.registerFont(TTFont('DejaVuSans', 'DejaVuSans.ttf'))
+        pdfmetrics.registerFont(TTFont('DejaVuSans-Bold', 'DejaVuSans-Bold.ttf'))
+        return 'DejaVuSans', 'DejaVuSans-Bold'
+    except Exception:
+        return 'Helvetica', 'Helvetica-Bold'
+
+
+def format_currency(amount) -> str:
+    """Rs. instead of ₹ for compatibility with the fallback fonts"""
+    return f"Rs. {int(amount):,}"
+
+
+def proposal_filename(response: Dict) -> str:
+    """'NHAI/2025/12345' -> 'NHAI_2025_12345_proposal.pdf'"""
+    rfp_id = re.sub(r"[^A-Za-z0-9._-]+", "_", str(response.get("rfp_id", "rfp"))).strip("_") or "rfp"
+    return f"{rfp_id}_proposal.pdf"
+
+
+def wrap_cell(text: str, width: float, font: str, size: float = BOM_FONT_SIZE) -> str:
+    """Break text onto lines (after spaces or hyphens) so it fits the column width
+
+    Plain strings with newlines are far cheaper for a Table to lay out than
+    Paragraph cells, which matters for BOMs with thousands of rows.
+    """
+    if stringWidth(text, font, size) <= width:
+        return text
+    lines, line = [], ""
+    for token in re.findall(r"[^\s-]+-?|\s+", text):
+        candidate = line + token
+        if line and stringWidth(candidate.rstrip(), font, size) > width:
+            lines.append(line.rstrip())
+            line = token.lstrip()
+        else:
+            line = candidate
+    lines.append(line.rstrip())
+    return "\n".join(lines)
+
+
+def bom_rows(response: Dict, font: Optional[str] = None) -> Iterator[List[str]]:
+    """One BOM row per recommended product: selected SKU, quantity and its catalog rate"""
+    font = font or register_fonts()[0]
+    for product_name, rec in response.get("technical_recommendations", {}).items():
+        quantity = rec["rfp_spec"].get("quantity", 0)
+        selected = next((m for m in rec["matches"] if m["sku"] == rec["selected_sku"]), rec["matches"][0])
+        rate = selected.get("unit_price", 0)
+        yield [
+            wrap_cell(product_name, DESCRIPTION_WIDTH, font),
+            wrap_cell(rec["selected_sku"], SKU_WIDTH, font),
+            f"{quantity:g} m",
+            f"Rs. {rate:g}/m",
+            format_currency(rate * quantity),
+            f"{rec['selected_match_score']:.0f}%",
+        ]
+
+
+def bom_rows_from_pricing(detailed_pricing: Iterable[Dict], match_scores: Optional[Dict[str, float]] = None,
+                          font: Optional[str] = None) -> Iterator[List[str]]:
+    """BOM rows straight from PricingAgent's detailed_pricing entries, one at a time
+
+    match_scores maps product name -> match %; products without one show '-'.
+    """
+    font = font or register_fonts()[0]
+    match_scores = match_scores or {}
+    for line in detailed_pricing:
+        score = match_scores.get(line["product"])
+        yield [
+            wrap_cell(str(line["product"]), DESCRIPTION_WIDTH, font),
+            wrap_cell(str(line["sku"]), SKU_WIDTH, font),
+            f"{line['quantity']:g} m",
+            f"Rs. {line['unit_price']:g}/m",
+            format_currency(line["material_cost"]),
+            f"{score:.0f}%" if score is not None else "-",
+        ]
+
+
+def bom_row_height(row: List[str]) -> float:
+    """Height of a BOM row as laid out by the table (cells are pre-wrapped strings)"""
+    return (max(cell.count("\n") for cell in row) + 1) * BOM_LEADING + BOM_PADDING
+
+
+BOM_HEADER_HEIGHT = bom_row_height(BOM_HEADER)
+
+
+class FlowableStream(list):
+    """A story list that pulls flowables from an iterator as the layout needs them
+
+    reportlab's build loop only looks at the front of the list (plus a short
+    lookahead for keepWithNext), so flowables are created just in time and
+    dropped once drawn instead of all being held up front.
+    """
+
+    LOOKAHEAD = 8
+
+    def __init__(self, flowables: Iterable):
+        super().__init__()
+        self._source = iter(flowables)
+
+    def _fill(self, count: int):
+        while self._source is not None and list.__len__(self) < count:
+            try:
+                self.append(next(self._source))
+            except StopIteration:
+                self._source = None
+
+    def _fill_for(self, index):
+        if isinstance(index, slice):
+            stop = index.stop
+            self._fill(stop if stop is not None and stop >= 0 else float("inf"))
+        else:
+            self._fill(index + 1 if index >= 0 else float("inf"))
+
+    def __len__(self) -> int:
+        self._fill(self.LOOKAHEAD)
+        return list.__len__(self)
+
+    def __getitem__(self, index):
+        self._fill_for(index)
+        return list.__getitem__(self, index)
+
+    def __delitem__(self, index):
+        self._fill_for(index)
+        list.__delitem__(self, index)
+
+
+class ProposalRenderer:
+    """Renders proposal PDFs from consolidated RFP responses
+
+    Fonts, paragraph styles and the fixed table styles are built once in
+    the constructor; render() only builds the per-proposal flowables.
+    """
+
+    def __init__(self, pagesize=A4, margin: float = 25*mm):
+        self.pagesize = pagesize
+        self.margin = margin
+        self.font, self.font_bold = register_fonts()
+        self._build_styles()
+        self._bom_styles: Dict[Tuple[int, bool], TableStyle] = {}
+        # Space inside the page frame (its padding is 6pt a side)
+        self.frame_width = pagesize[0] - 2 * margin - 12
+        self.frame_height = pagesize[1] - 2 * margin - 12
+
+    def _build_styles(self):
+        styles = getSampleStyleSheet()
+        font, font_bold = self.font, self.font_bold
+
+        # ============= PARAGRAPH STYLES =============
+        self.title_style = ParagraphStyle(
+            'CustomTitle', parent=styles['Title'], fontSize=24, leading=30, spaceAfter=6,
+            textColor=DARK_BLUE, alignment=TA_CENTER, fontName=font_bold,
+        )
+        self.subtitle_style = ParagraphStyle(
+            'Subtitle', parent=styles['Normal'], fontSize=16, leading=20, spaceAfter=20,
+            textColor=MID_BLUE, alignment=TA_CENTER, fontName=font_bold,
+        )
+        self.section_header_style = ParagraphStyle(
+            'SectionHeader', parent=styles['Heading2'], fontSize=14, leading=18, spaceAfter=12,
+            spaceBefore=20, textColor=DARK_BLUE, fontName=font_bold, borderWidth=1,
+            borderColor=MID_BLUE, borderPadding=8, backColor=LIGHT_BLUE,
+        )
+        self.footer_style = ParagraphStyle(
+            'Footer', parent=styles['Normal'], fontSize=9, textColor=colors.grey,
+            alignment=TA_CENTER, spaceAfter=0,
+        )
+
+        # ============= FIXED TABLE STYLES =============
+        # NO <b> TAGS - bold labels come from the table style
+        self.client_table_style = TableStyle([
+            ('BACKGROUND', (0,0), (0,-1), LIGHT_BLUE),
+            ('BACKGROUND', (1,0), (1,-1), colors.white),
+            ('TEXTCOLOR', (0,0), (-1,-1), DARK_BLUE),
+            ('ALIGN', (0,0), (-1,-1), 'LEFT'),
+            ('FONTNAME', (0,0), (0,-1), font_bold),
+            ('FONTNAME', (1,0), (1,-1), font),
+            ('FONTSIZE', (0,0), (-1,-1), 11),
+            ('GRID', (0,0), (-1,-1), 1, MID_BLUE),
+            ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
+            ('LEFTPADDING', (0,0), (-1,-1), 10),
+            ('RIGHTPADDING', (0,0), (-1,-1), 10),
+            ('TOPPADDING', (0,0), (-1,-1), 8),
+            ('BOTTOMPADDING', (0,0), (-1,-1), 8),
+        ])
+        self.summary_table_style = TableStyle([
+            ('BACKGROUND', (0,0), (0,-1), PALE_BLUE),
+            ('BACKGROUND', (1,0), (1,-1), colors.white),
+            ('TEXTCOLOR', (0,0), (-1,-1), TEXT_GREY),
+            ('ALIGN', (0,0), (0,-1), 'LEFT'),
+            ('ALIGN', (1,0), (1,-1), 'RIGHT'),
+            ('FONTNAME', (0,0), (0,-1), font_bold),
+            ('FONTNAME', (1,0), (1,-1), font),
+            ('FONTSIZE', (0,0), (-1,-1), 11),
+            ('GRID', (0,0), (-1,-1), 0.5, GRID_BLUE),
+            ('BOX', (0,0), (-1,-1), 1.5, MID_BLUE),
+            ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
+            ('LEFTPADDING', (0,0), (-1,-1), 10),
+            ('RIGHTPADDING', (0,0), (-1,-1), 10),
+            ('TOPPADDING', (0,0), (-1,-1), 8),
+            ('BOTTOMPADDING', (0,0), (-1,-1), 8),
+        ])
+
+    def bom_table_style(self, n_items: int, totals: bool = True) -> TableStyle:
+        """BOM style for a header, n_items item rows and (optionally) three total rows
+
+        Row indices come from the data length; styles are cached per shape,
+        so a long BOM split into equal page-sized tables reuses one style.
+        """
+        key = (n_items, totals)
+        style = self._bom_styles.get(key)
+        if style is None:
+            style = self._bom_styles[key] = TableStyle(self._bom_style_commands(n_items, totals))
+        return style
+
+    def _bom_style_commands(self, n_items: int, totals: bool) -> List[Tuple]:
+        font, font_bold = self.font, self.font_bold
+        last_item = n_items                # header is row 0
+        commands = [
+            # Header row
+            ('BACKGROUND', (0,0), (-1,0), DARK_BLUE),
+            ('TEXTCOLOR', (0,0), (-1,0), colors.white),
+            ('FONTNAME', (0,0), (-1,0), font_bold),
+            ('FONTSIZE', (0,0), (-1,0), 10),
+            ('TEXTCOLOR', (0,1), (-1,-1), TEXT_GREY),
+            ('WORDWRAP', (0,0), (-1,-1), True),
+            ('LEADING', (0,0), (-1,-1), BOM_LEADING),
+
+            # Column alignment: description/SKU left, qty/match centered, money right
+            ('ALIGN', (0,0), (1,last_item), 'LEFT'),
+            ('ALIGN', (2,0), (2,last_item), 'CENTER'),
+            ('ALIGN', (3,0), (4,-1), 'RIGHT'),
+            ('ALIGN', (5,0), (5,last_item), 'CENTER'),
+
+            # Grid and borders
+            ('GRID', (0,0), (-1,-1), 0.5, GRID_BLUE),
+            ('BOX', (0,0), (-1,-1), 1.5, MID_BLUE),
+
+            # Padding - reduced for SKU column
+            ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
+            ('LEFTPADDING', (0,0), (0,-1), 8),
+            ('LEFTPADDING', (1,0), (1,-1), 6),
+            ('LEFTPADDING', (2,0), (-1,-1), 8),
+            ('RIGHTPADDING', (0,0), (0,-1), 8),
+            ('RIGHTPADDING', (1,0), (1,-1), 4),
+            ('RIGHTPADDING', (2,0), (-1,-1), 8),
+            ('TOPPADDING', (0,0), (-1,-1), 8),
+            ('BOTTOMPADDING', (0,0), (-1,-1), 8),
+        ]
+        if n_items:
+            commands += [
+                ('BACKGROUND', (0,1), (-1,last_item), colors.white),
+                ('FONTNAME', (0,1), (-1,last_item), font),
+                ('FONTSIZE', (0,1), (-1,last_item), BOM_FONT_SIZE),
+            ]
+        if totals:
+            subtotal, grand = n_items + 1, n_items + 3
+            commands += [
+                # Subtotal rows (bold through style)
+                ('BACKGROUND', (0,subtotal), (-1,grand - 1), PALE_BLUE),
+                ('FONTNAME', (3,subtotal), (4,grand - 1), font_bold),
+                ('FONTSIZE', (0,subtotal), (-1,grand - 1), 9),
+                ('LINEABOVE', (0,subtotal), (-1,subtotal), 1.5, MID_BLUE),
+
+                # Grand total row (larger and bolder)
+                ('BACKGROUND', (0,grand), (-1,grand), LIGHT_BLUE),
+                ('FONTNAME', (3,grand), (4,grand), font_bold),
+                ('FONTSIZE', (3,grand), (4,grand), 11),
+                ('LINEABOVE', (0,grand), (-1,grand), 2, DARK_BLUE),
+            ]
+        return commands
+
+    def _bom_chunks(self, rows: Iterable[List[str]], first_height: float) -> Iterator[Tuple[List[List[str]], float, float]]:
+        """(rows, table height, space available) per table, each filling what is left of its page
+
+        Heights come from each row's line count, so tables never need
+        splitting by the layout. A table whose first row does not fit in
+        first_height starts on the next page.
+        """
+        available = first_height
+        chunk, height = [], BOM_HEADER_HEIGHT
+        for row in rows:
+            row_height = bom_row_height(row)
+            if height + row_height > available:
+                if chunk:
+                    yield chunk, height, available
+                    chunk, height = [], BOM_HEADER_HEIGHT
+                available = self.frame_height
+            chunk.append(row)
+            height += row_height
+        yield chunk, height, available
+
+    def bom_tables(self, rows: Iterable[List[str]], pricing: Dict,
+                   first_height: Optional[float] = None) -> Iterator:
+        """Page-sized BOM tables with a repeated header; the last one carries the totals
+
+        first_height is the space left on the page the BOM starts on (a
+        full page by default). Rows are pulled from the iterable one table
+        at a time, so only two tables' worth of rows are held however long
+        the BOM is.
+        """
+        totals = [
+            ['', '', '', 'Material Subtotal', format_currency(pricing["material_cost"]), ''],
+            ['', '', '', 'Testing & QA', format_currency(pricing["test_cost"]), ''],
+            ['', '', '', 'GRAND TOTAL', format_currency(pricing["grand_total"]), ''],
+        ]
+        totals_height = sum(bom_row_height(row) for row in totals)
+        chunks = self._bom_chunks(rows, self.frame_height if first_height is None else first_height)
+        chunk, height, available = next(chunks)
+        for next_chunk in chunks:
+            yield Table([BOM_HEADER] + chunk, colWidths=BOM_COL_WIDTHS, repeatRows=1,
+                        style=self.bom_table_style(len(chunk), totals=False))
+            chunk, height, available = next_chunk
+        # Carry the last rows over to a fresh page when the totals do not fit below them
+        tail: List[List[str]] = []
+        while len(chunk) > 1 and height + totals_height > available:
+            height -= bom_row_height(chunk[-1])
+            tail.insert(0, chunk.pop())
+        if tail:
+            yield Table([BOM_HEADER] + chunk, colWidths=BOM_COL_WIDTHS, repeatRows=1,
+                        style=self.bom_table_style(len(chunk), totals=False))
+            yield PageBreak()
+            chunk = tail
+        yield Table([BOM_HEADER] + chunk + totals, colWidths=BOM_COL_WIDTHS, repeatRows=1,
+                    style=self.bom_table_style(len(chunk)))
+
+    def _height(self, flowable) -> float:
+        """Frame space a flowable takes, including its spacing"""
+        height = flowable.wrap(self.frame_width, self.frame_height)[1]
+        return height + flowable.getSpaceBefore() + flowable.getSpaceAfter()
+
+    def story(self, response: Dict, bom: Optional[Iterable[List[str]]] = None) -> Iterator:
+        """Flowables for one proposal, generated as the layout consumes them
+
+        bom defaults to rows derived from the recommendations; pass a
+        generator (e.g. bom_rows_from_pricing) to stream a large BOM.
+        """
+        pricing = response["pricing_summary"]
+        preamble = [
+            Paragraph("RFP PROPOSAL", self.title_style),
+            Paragraph(response.get("project_name", "RFP Response"), self.subtitle_style),
+            Spacer(1, 10),
+        ]
+
+        # ============= CLIENT INFO BOX =============
+        client_info = [
+            ['Client', response['client_name']],
+            ['Project ID', response['rfp_id']],
+            ['Due Date', response['due_date']],
+            ['Strategic Fit Score', f'{response["strategic_fit_score"]}%'],
+        ]
+        preamble += [Table(client_info, colWidths=INFO_COL_WIDTHS, style=self.client_table_style), Spacer(1, 25)]
+
+        # ============= PROJECT SUMMARY BOX =============
+        summary_data = [
+            ['Project Value', format_currency(pricing["grand_total"])],
+            ['Material Cost', format_currency(pricing["material_cost"])],
+            ['Testing Cost', format_currency(pricing["test_cost"])],
+            ['Status', 'AI Generated - Ready for Review'],
+        ]
+        preamble += [
+            Paragraph("PROJECT SUMMARY", self.section_header_style),
+            Table(summary_data, colWidths=INFO_COL_WIDTHS, style=self.summary_table_style),
+            Spacer(1, 25),
+        ]
+
+        # ============= BILL OF MATERIALS =============
+        preamble.append(Paragraph("BILL OF MATERIALS & PRICING", self.section_header_style))
+        # The first BOM table only gets what is left of page one
+        first_height = self.frame_height - sum(self._height(flowable) for flowable in preamble)
+        yield from preamble
+        rows = bom_rows(response, self.font) if bom is None else bom
+        yield from self.bom_tables(rows, pricing, first_height)
+        yield Spacer(1, 30)
+
+    @instrument("pdf.render")
+    def render(self, response: Dict, output: Union[str, BinaryIO, None] = None,
+               bom: Optional[Iterable[List[str]]] = None) -> Union[str, bytes]:
+        """Write one proposal to a path or file object; with no output, return the PDF bytes"""
+        target = BytesIO() if output is None else output
+        doc = SimpleDocTemplate(
+            target, pagesize=self.pagesize,
+            rightMargin=self.margin, leftMargin=self.margin,
+            topMargin=self.margin, bottomMargin=self.margin,
+            title=f"RFP Proposal - {response.get('rfp_id', '')}",
+        )
+        with stage("pdf.build"):
+            doc.build(FlowableStream(self.story(response, bom)))
+        return target.getvalue() if output is None else output
+
+    def render_many(self, responses: Iterable[Dict], output_dir: str) -> List[str]:
+        """Render sequentially in this process, reusing the styles"""
+        responses = list(responses)
+        paths = output_paths(responses, output_dir)
+        return [self.render(response, path) for response, path in zip(responses, paths)]
+
+
+def output_paths(responses: List[Dict], output_dir: str) -> List[str]:
+    """One file per response in output_dir, suffixed when two RFP ids sanitize alike"""
+    os.makedirs(output_dir, exist_ok=True)
+    paths = []
+    seen: Dict[str, int] = {}
+    for response in responses:
+        path = os.path.join(output_dir, proposal_filename(response))
+        count = seen.get(path, 0)
+        seen[path] = count + 1
+        if count:
+            root, ext = os.path.splitext(path)
+            path = f"{root}_{count + 1}{ext}"
+        paths.append(path)
+    return paths
+
+
+# ===== BATCH RENDERING =====
+# Each pool worker builds its renderer once and reuses it for every proposal it gets.
+
+_worker_renderer: Optional[ProposalRenderer] = None
+
+
+def _init_worker():
+    global _worker_renderer
+    _worker_renderer = ProposalRenderer()
+
+
+def _render_in_worker(response: Dict, output_path: str) -> str:
+    return _worker_renderer.render(response, output_path)
+
+
+def render_batch(responses: Iterable[Dict], output_dir: str = "proposals",
+                 max_workers: Optional[int] = None) -> List[str]:
+    """Render many proposals across a process pool; returns the paths in input order"""
+    responses = list(responses)
+    paths = output_paths(responses, output_dir)
+    max_workers = min(max_workers or os.cpu_count() or 1, len(responses))
+    if max_workers <= 1:
+        renderer = ProposalRenderer()
+        return [renderer.render(response, path) for response, path in zip(responses, paths)]
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker) as pool:
+        return list(pool.map(_render_in_worker, responses, paths))
@@ -0,0 +1,190 @@
+# utils/result_store.py
+import json
+import os
+import sys
+import threading
+from contextlib import contextmanager
+from datetime import date, datetime
+from typing import Dict, Iterator, List, NamedTuple, Optional
+
+try:
+    import orjson
+except ImportError:  # Compact stdlib JSON is the fallback
+    orjson = None
+
+try:
+    import fcntl
+except ImportError:  # Windows: only writers within one process are serialized
+    fcntl = None
+
+# Responses are appended to one newline-delimited JSON file. A sidecar index
+# (<path>.idx, also NDJSON) holds one [rfp_id, generated_at, offset, length]
+# entry per record, so a past response is read with a single seek. Writers
+# take an exclusive lock on the index file, append the record, then its
+# entry, which means every indexed offset points at a complete record.
+INDEX_SUFFIX = ".idx"
+
+
+class IndexEntry(NamedTuple):
+    """Where one stored response lives in the data file"""
+    rfp_id: str
+    generated_at: str
+    offset: int
+    length: int
+
+
+def json_default(value):
+    """Types the JSON encoder does not handle natively (anything else is an error)"""
+    # numpy values can only come from code that has already imported numpy
+    np = sys.modules.get("numpy")
+    if np is not None and isinstance(value, np.generic):
+        return value.item()
+    if np is not None and isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(record) -> bytes:
+    """Compact single-line JSON"""
+    if orjson is not None:
+        return orjson.dumps(record, default=json_default,
+                            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(record, default=json_default, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def loads(data: bytes):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _write_all(fd: int, data: bytes):
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+class ResultStore:
+    """Append-only store of RFP responses, indexed by RFP id and timestamp
+
+    Safe for any number of writers across threads and processes. Readers
+    load the index once and then only read entries appended since.
+    """
+
+    def __init__(self, path: str = "data/results/rfp_responses.ndjson"):
+        self.path = path
+        self.index_path = path + INDEX_SUFFIX
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._by_id: Dict[str, List[IndexEntry]] = {}
+        self._entries: List[IndexEntry] = []
+        self._index_size = 0
+        if os.path.exists(path) and not os.path.exists(self.index_path):
+            self.rebuild_index()
+
+    @contextmanager
+    def _locked_files(self):
+        """Data and index file descriptors, held under the cross-process write lock"""
+        # Opened per write, so processes forked from this one never share a lock
+        index_fd = os.open(self.index_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        data_fd = os.open(self.path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            if fcntl is not None:
+                fcntl.flock(index_fd, fcntl.LOCK_EX)
+            yield data_fd, index_fd
+        finally:
+            os.close(data_fd)
+            os.close(index_fd)  # Also releases the lock
+
+    def append(self, response: Dict) -> IndexEntry:
+        """Store one response; returns its index entry"""
+        line = dumps(response) + b"\n"
+        rfp_id = str(response.get("rfp_id", "N/A"))
+        generated_at = str(response.get("generated_at") or datetime.now().isoformat())
+        with self._lock, self._locked_files() as (data_fd, index_fd):
+            offset = os.lseek(data_fd, 0, os.SEEK_END)
+            # A writer that died mid-record leaves a torn line; start on a fresh one
+            if offset and os.pread(data_fd, 1, offset - 1) != b"\n":
+                _write_all(data_fd, b"\n")
+                offset += 1
+            _write_all(data_fd, line)
+            entry = IndexEntry(rfp_id, generated_at, offset, len(line))
+            _write_all(index_fd, dumps(list(entry)) + b"\n")
+        return entry
+
+    def _refresh(self):
+        """Read index entries appended since the last call"""
+        try:
+            with open(self.index_path, "rb") as f:
+                f.seek(self._index_size)
+                data = f.read()
+        except FileNotFoundError:
+            return
+        # A line still being written has no newline yet; pick it up next time
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            try:
+                entry = IndexEntry(*loads(line))
+            except (ValueError, TypeError):
+                continue
+            self._entries.append(entry)
+            self._by_id.setdefault(entry.rfp_id, []).append(entry)
+        self._index_size += end
+
+    def _read(self, entry: IndexEntry) -> Dict:
+        with open(self.path, "rb") as f:
+            f.seek(entry.offset)
+            return loads(f.read(entry.length))
+
+    def history(self, rfp_id: str) -> List[IndexEntry]:
+        """Index entries for one RFP, oldest first"""
+        with self._lock:
+            self._refresh()
+            return list(self._by_id.get(rfp_id, []))
+
+    def get(self, rfp_id: str, generated_at: Optional[str] = None) -> Optional[Dict]:
+        """Latest stored response for an RFP, or the one generated at a given time (None when absent)"""
+        entries = self.history(rfp_id)
+        if generated_at is not None:
+            entries = [entry for entry in entries if entry.generated_at == generated_at]
+        return self._read(entries[-1]) if entries else None
+
+    def latest(self) -> Optional[Dict]:
+        """Most recently stored response for any RFP"""
+        with self._lock:
+            self._refresh()
+            entry = self._entries[-1] if self._entries else None
+        return self._read(entry) if entry else None
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._refresh()
+            return len(self._entries)
+
+    def iter_records(self) -> Iterator[Dict]:
+        """Every stored response in append order (a full scan)"""
+        with open(self.path, "rb") as f:
+            for line in f:
+                if line.strip():
+                    try:
+                        yield loads(line)
+                    except ValueError:
+                        continue  # Torn record from a crashed writer
+
+    def rebuild_index(self):
+        """Regenerate the index by scanning the data file"""
+        with self._lock, self._locked_files() as (data_fd, index_fd):
+            os.ftruncate(index_fd, 0)
+            offset = 0
+            with open(self.path, "rb") as f:
+                for line in f:
+                    try:
+                        record = loads(line)
+                    except ValueError:
+                        record = None
+                    if isinstance(record, dict):
+                        entry = IndexEntry(str(record.get("rfp_id", "N/A")), str(record.get("generated_at", "")),
+                                           offset, len(line))
+                        _write_all(index_fd, dumps(list(entry)) + b"\n")
+                    offset += len(line)
+            self._by_id, self._entries, self._index_size = {}, [], 0
@@ -0,0 +1,67 @@
+import re
+from typing import Dict, List, NamedTuple
+
+# Section name -> heading pattern. Add new sections here; they all compile
+# into one regex so the document is still scanned once.
+SECTION_PATTERNS = {
+    "scope": r"scope\s+of\s+(?:supply|work)",
+    "technical": r"technical\s+specifications?",
+    "tests": r"(?:acceptance\s+(?:&|and)\s+)?tests?\s+requirements|acceptance\s+tests?\b|tests?\s+(?:&|and)\s+costs?",
+    "eligibility": r"eligibility(?:\s+criteria)?|qualification\s+criteria",
+    "boq": r"bill\s+of\s+quantit(?:y|ies)|\bboq\b",
+    "delivery": r"delivery\s+(?:schedule|timeline|period|(?:&|and)\s+payment)",
+    "pricing": r"pricing|price\s+(?:schedule|bid)",
+    "evaluation": r"evaluation\s+criteria",
+}
+
+# A heading is a short line in a heading form: a markdown "#" or section
+# number ("4.1"), **bold**, or ALL CAPS. It holds up to three leading words
+# ("Acceptance & ..."), the section keyword and a short tail. Bullets
+# ("- Delivery Period: 60 days") and "key: value" lines are never headings,
+# so field lines inside a section do not cut it short. The prefix advances a
+# word at a time, which keeps failed matches cheap. Any other top-level
+# heading ("## 8. SUBMISSION FORMAT") becomes an "other" section so it still
+# closes the section before it.
+SECTION_NUMBER = r"\d+(?:\.\d+)*\.?[ \t]+"
+HEADING_PATTERN = re.compile(
+    r"^(?:"
+    r"[ \t]*(?:#{1,6}[ \t]+(?:" + SECTION_NUMBER + r")?|" + SECTION_NUMBER + r"|\*\*(?:" + SECTION_NUMBER + r")?"
+    r"|(?=[^a-z\n]+$)(?:" + SECTION_NUMBER + r")?)"
+    r"(?i:(?:\w[\w-]*[ \t]+(?:[&/][ \t]+)?){0,3}"
+    r"(?:" + "|".join(f"(?P<{name}>{pattern})" for name, pattern in SECTION_PATTERNS.items()) + r")"
+    r"[^\n:*]{0,30})\**:?"
+    r"|(?P<other>[ \t]*(?:#{1,2}[ \t]+[^\n]+|\d+\.[ \t]+[A-Z][A-Z0-9 &/,()-]{2,60}))"
+    r")[ \t]*$",
+    re.MULTILINE,
+)
+
+
+class Section(NamedTuple):
+    """A named section as offsets into the original text"""
+    name: str
+    start: int       # start of the heading line
+    body_start: int  # first character after the heading line
+    end: int         # start of the next heading (or end of text)
+
+
+def segment_sections(text: str) -> List[Section]:
+    """Split RFP text into named sections in one linear pass, without copying"""
+    sections = []
+    headings = list(HEADING_PATTERN.finditer(text))
+    for i, match in enumerate(headings):
+        end = headings[i + 1].start() if i + 1 < len(headings) else len(text)
+        body_start = min(match.end() + 1, end)
+        sections.append(Section(match.lastgroup, match.start(), body_start, end))
+    return sections
+
+
+def sections_by_name(sections: List[Section]) -> Dict[str, List[Section]]:
+    grouped: Dict[str, List[Section]] = {}
+    for section in sections:
+        grouped.setdefault(section.name, []).append(section)
+    return grouped
+
+
+def section_text(text: str, section: Section) -> str:
+    """Body of a section (the only place a substring is materialized)"""
+    return text[section.body_start:section.end]
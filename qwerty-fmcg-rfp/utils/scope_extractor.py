@@ -0,0 +1,190 @@
+import re
+from typing import Dict, List, Optional
+
+from utils.rfp_segmenter import Section
+
+# "**Item 1: High Voltage Power Cables (1.1kV)**", "Cable Type 2: ...", "S.No. 3 - ..."
+ITEM_HEADER = r"^[ \t*#]*(?:item|cable\s+type|line\s+item|s\.?\s*no\.?)[ \t]*(?P<item_no>\d+)[ \t]*[:.)-]?[ \t]*(?P<description>[^\n]*?)[ \t*]*$"
+# "- Conductor Size: 240 mm²"
+FIELD_LINE = r"^[ \t]*[-*•]?[ \t]*(?P<key>[A-Za-z][A-Za-z .()/]{0,40}?)[ \t]*:[ \t]*(?P<value>[^\n]*?)[ \t]*$"
+
+LINE_PATTERN = re.compile(f"(?P<header>{ITEM_HEADER})|(?P<field>{FIELD_LINE})", re.IGNORECASE | re.MULTILINE)
+
+# Field label (lowercased) -> spec key
+FIELD_ALIASES = {
+    "quantity": "quantity", "qty": "quantity", "required quantity": "quantity", "length": "quantity",
+    "conductor size": "conductor_size", "size": "conductor_size", "cross section": "conductor_size",
+    "cross sectional area": "conductor_size", "conductor cross section": "conductor_size",
+    "material": "material", "conductor material": "material", "conductor": "material",
+    "insulation": "insulation_type", "insulation type": "insulation_type", "insulation material": "insulation_type",
+    "core count": "core_count", "cores": "core_count", "no. of cores": "core_count", "number of cores": "core_count",
+    "armoring": "armoring", "armouring": "armoring", "armour": "armoring", "armor": "armoring",
+    "rated voltage": "voltage_rating", "voltage": "voltage_rating", "voltage rating": "voltage_rating",
+    "voltage grade": "voltage_rating",
+    "temperature rating": "temperature_rating", "max temperature": "temperature_rating",
+    "operating temperature": "temperature_rating",
+}
+
+NUMBER = r"(\d[\d,]*(?:\.\d+)?)"
+QUANTITY_VALUE = re.compile(NUMBER + r"[ \t]*(km|kilomet(?:er|re)s?|m\b|mtrs?\b|met(?:er|re)s?|rm\b)?", re.IGNORECASE)
+SIZE_VALUE = re.compile(NUMBER + r"[ \t]*(?:mm²|mm2|sq\.?[ \t]*mm|mm\^2|sqmm)", re.IGNORECASE)
+VOLTAGE_VALUE = re.compile(r"(?:\d+(?:\.\d+)?[ \t]*/[ \t]*)?(\d+(?:\.\d+)?)[ \t]*(kv|v)\b", re.IGNORECASE)
+CORES_VALUE = re.compile(r"(\d+(?:\.\d+)?)[ \t]*(?:c\b|cores?\b|core\b)?", re.IGNORECASE)
+CORES_IN_TEXT = re.compile(r"(\d+(?:\.\d+)?)[ \t]*(?:c\b|[ -]?cores?\b)", re.IGNORECASE)
+TEMPERATURE_VALUE = re.compile(r"(\d+)[ \t]*°?[ \t]*c\b", re.IGNORECASE)
+MATERIAL_VALUE = re.compile(r"\b(copper|cu|alumin(?:i)?um|al)\b", re.IGNORECASE)
+INSULATION_VALUE = re.compile(r"\b(xlpe|pvc|epr|hepr|lszh)\b", re.IGNORECASE)
+ARMOUR_IN_TEXT = re.compile(r"\b(steel[ \t]+(?:tape|wire|strip))\b|\b(unarmou?red)\b", re.IGNORECASE)
+
+MATERIALS = {"copper": "Copper", "cu": "Copper", "aluminum": "Aluminum", "aluminium": "Aluminum", "al": "Aluminum"}
+
+
+def _to_number(text: str) -> float:
+    return float(text.replace(",", ""))
+
+
+def _whole(value: float):
+    """Keep whole numbers as int (quantities print as 1000, not 1000.0)"""
+    return int(value) if float(value).is_integer() else value
+
+
+def parse_quantity(value: str) -> Optional[float]:
+    """Quantity in meters ('1,000 meters', '2.5 km')"""
+    match = QUANTITY_VALUE.search(value)
+    if not match:
+        return None
+    quantity = _to_number(match.group(1))
+    unit = (match.group(2) or "").lower()
+    if unit.startswith("k"):
+        quantity *= 1000
+    return _whole(quantity)
+
+
+def parse_conductor_size(value: str) -> Optional[float]:
+    """Conductor size in mm² ('240 mm²', '240 sq.mm'); bare numbers are taken as mm²"""
+    match = SIZE_VALUE.search(value) or re.match(r"\s*" + NUMBER, value)
+    return _to_number(match.group(1)) if match else None
+
+
+def parse_voltage(value: str) -> Optional[float]:
+    """Rated voltage in kV ('1.1 kV', '1100 V', '0.6/1 kV' -> 1.0)"""
+    match = VOLTAGE_VALUE.search(value)
+    if not match:
+        return None
+    voltage = float(match.group(1))
+    return round(voltage / 1000, 3) if match.group(2).lower() == "v" else voltage
+
+
+def parse_core_count(value: str) -> Optional[float]:
+    match = CORES_VALUE.search(value)
+    return float(match.group(1)) if match else None
+
+
+def parse_temperature(value: str) -> Optional[int]:
+    match = TEMPERATURE_VALUE.search(value) or re.search(r"(\d+)", value)
+    return int(match.group(1)) if match else None
+
+
+def parse_material(value: str) -> Optional[str]:
+    """First conductor material mentioned, in catalog spelling"""
+    match = MATERIAL_VALUE.search(value)
+    return MATERIALS[match.group(1).lower()] if match else None
+
+
+def parse_insulation(value: str) -> Optional[str]:
+    match = INSULATION_VALUE.search(value)
+    if match:
+        return match.group(1).upper()
+    return value.split("(")[0].strip() or None
+
+
+def parse_armoring(value: str) -> str:
+    """Catalog spelling: 'Steel Tape', 'Steel Wire', 'None'"""
+    value = value.split("(")[0].strip()
+    if not value or value.lower() in ("none", "nil", "unarmoured", "unarmored", "no"):
+        return "None"
+    return value.title()
+
+
+FIELD_PARSERS = {
+    "quantity": parse_quantity,
+    "conductor_size": parse_conductor_size,
+    "material": parse_material,
+    "insulation_type": parse_insulation,
+    "core_count": parse_core_count,
+    "armoring": parse_armoring,
+    "voltage_rating": parse_voltage,
+    "temperature_rating": parse_temperature,
+}
+
+
+def _parse_description(description: str) -> Dict:
+    """Specs written inline in an item header or one-line BOQ entry"""
+    spec = {}
+    voltage = parse_voltage(description)
+    if voltage is not None:
+        spec["voltage_rating"] = voltage
+    size = SIZE_VALUE.search(description)
+    if size:
+        spec["conductor_size"] = _to_number(size.group(1))
+    cores = CORES_IN_TEXT.search(description)
+    if cores:
+        spec["core_count"] = float(cores.group(1))
+    material = parse_material(description)
+    if material:
+        spec["material"] = material
+    insulation = INSULATION_VALUE.search(description)
+    if insulation:
+        spec["insulation_type"] = insulation.group(1).upper()
+    armour = ARMOUR_IN_TEXT.search(description)
+    if armour:
+        spec["armoring"] = armour.group(1).title() if armour.group(1) else "None"
+    quantity = re.search(NUMBER + r"[ \t]*(km|mtrs?|met(?:er|re)s?|m)\b", description, re.IGNORECASE)
+    if quantity:
+        spec["quantity"] = parse_quantity(quantity.group(0))
+    return spec
+
+
+def _product_name(spec: Dict, item_no: str) -> str:
+    if spec.get("voltage_rating") is not None and spec.get("conductor_size") is not None:
+        return f"{spec['voltage_rating']:g}kV Cable {spec['conductor_size']:g}mm²"
+    return f"Item {item_no}"
+
+
+def extract_line_items(text: str, sections: Optional[List[Section]] = None) -> List[Dict]:
+    """Turn "Item N" blocks in RFP text into spec dicts for SpecMatcher
+
+    Only the scope/BOQ sections are scanned when sections are given (by
+    offset, without copying the text); otherwise the whole document is.
+    """
+    spans = [(s.body_start, s.end) for s in sections or [] if s.name in ("scope", "boq")]
+    if not spans:
+        spans = [(0, len(text))]
+
+    items = []
+    current = None
+    for start, end in spans:
+        for match in LINE_PATTERN.finditer(text, start, end):
+            if match.group("header"):
+                current = _parse_description(match.group("description"))
+                current["item_no"] = match.group("item_no")
+                items.append(current)
+            elif current is not None:
+                field = FIELD_ALIASES.get(match.group("key").lower().strip())
+                if field:
+                    value = FIELD_PARSERS[field](match.group("value"))
+                    if value is not None:
+                        current[field] = value
+        current = None
+
+    scope = []
+    names = set()
+    for item in items:
+        item_no = item.pop("item_no")
+        name = _product_name(item, item_no)
+        if name in names:
+            name = f"{name} (Item {item_no})"
+        names.add(name)
+        item.setdefault("quantity", 0)
+        scope.append({"product_name": name, **item})
+    return scope
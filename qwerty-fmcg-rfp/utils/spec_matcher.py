@@ -1,13 +1,150 @@
-import pandas as pd
-from typing import List, Dict, Tuple
-from difflib import SequenceMatcher
+import numpy as np
+from typing import List, Dict, Optional, Tuple, Union
+
+from utils.catalog_repository import MANDATORY_COLUMNS, CatalogRepository
+from utils.instrumentation import instrument
+
+# Best score a row can reach with at most 3 of 4 mandatory fields matching.
+# A spec's exact-match bucket is only trusted when its K-th score beats this.
+OUTSIDE_BUCKET_MAX_SCORE = 0.40 * 75 + 0.30 * 100 + 0.20 * 100 + 0.10 * 100
+
+# (spec, row) pairs scored per chunk of bucket lookups. Each pair holds about
+# a dozen 8-byte temporaries, so a chunk stays under 0.5 MB; larger chunks use more
+# memory without being faster.
+BUCKET_PAIRS_PER_CHUNK = 4096
+
+# Catalog columns read by calculate_exact_match and _build_match
+DETAIL_COLUMNS = [
+    "product_sku", "voltage_rating_kv", "conductor_size_mm2", "material", "insulation_type", "core_count",
+    "bis_certified", "unit_price_per_meter", "lead_time_days", "temperature_rating_celsius",
+]
 
 class SpecMatcher:
     """Matches RFP specs to OEM product catalog"""
     
-    def __init__(self, catalog_csv_path: str):
-        self.catalog = pd.read_csv(catalog_csv_path)
-        print(f"[SpecMatcher] Loaded {len(self.catalog)} products from catalog")
+    @instrument("spec_matcher.load_catalog")
+    def __init__(self, catalog: Union[str, CatalogRepository], vectorized: bool = True):
+        """catalog is a shared CatalogRepository, or a catalog path to load one from"""
+        if not isinstance(catalog, CatalogRepository):
+            catalog = CatalogRepository(catalog)
+        self.repository = catalog
+        self.catalog = catalog.catalog
+        self.vectorized = vectorized
+        # Encoded columns and exact-match buckets live on the repository
+        spec_index = catalog.spec_index
+        self._mandatory_codes = spec_index.mandatory_codes
+        self._mandatory_vocab = spec_index.mandatory_vocab
+        self._core_count = spec_index.core_count
+        self._cert_score = spec_index.cert_score
+        self._buckets = spec_index.buckets
+        # Winners' rows are read from plain column arrays rather than with iloc
+        self._detail_columns = {column: self.catalog[column].to_numpy() for column in DETAIL_COLUMNS}
+    
+    def _spec_codes(self, rfp_spec: Dict) -> Tuple:
+        """Mandatory field codes for a spec (-1 where the value is not in the catalog)"""
+        return tuple(
+            vocab.get(str(rfp_spec.get(spec_key)).lower(), -1)
+            for (spec_key, _, _), vocab in zip(MANDATORY_COLUMNS, self._mandatory_vocab)
+        )
+    
+    def _lookup_buckets(self, rfp_specs: List[Dict], top_k: int,
+                        max_pairs: int = BUCKET_PAIRS_PER_CHUNK) -> List[Optional[Tuple[np.ndarray, np.ndarray]]]:
+        """Top-K (rows, scores) per spec from its exact-match bucket, or None to fall back to a scan
+
+        Every spec's bucket rows are scored together as one flat array of
+        (spec, row) pairs, chunked to at most max_pairs pairs.
+        """
+        hits: List[Optional[Tuple[np.ndarray, np.ndarray]]] = [None] * len(rfp_specs)
+        if top_k <= 0:
+            return hits
+        spec_codes = [self._spec_codes(spec) for spec in rfp_specs]
+        candidates = []
+        for i, codes in enumerate(spec_codes):
+            rows = self._buckets.get(codes)
+            if rows is not None and len(rows) >= top_k:
+                candidates.append((i, rows))
+        
+        start = 0
+        while start < len(candidates):
+            # At least one spec per chunk, however large its bucket
+            stop, cells = start + 1, len(candidates[start][1])
+            while stop < len(candidates) and cells + len(candidates[stop][1]) <= max_pairs:
+                cells += len(candidates[stop][1])
+                stop += 1
+            batch = candidates[start:stop]
+            start = stop
+            
+            specs = np.array([i for i, _ in batch])
+            sizes = np.array([len(rows) for _, rows in batch])
+            owner = np.repeat(np.arange(len(batch)), sizes)
+            rows = np.concatenate([rows for _, rows in batch])
+            codes = np.array([spec_codes[i] for i in specs], dtype=int)
+            rfp_core = np.array([float(rfp_specs[i].get("core_count", 0)) for i in specs])
+            scores = self._score(codes[owner], rfp_core[owner], rows)
+            
+            # Sort each spec's pairs by score, ties in bucket (catalog) order; its top-K lead its segment
+            order = np.lexsort((np.arange(len(rows)), -scores, owner))
+            firsts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+            winners = order[firsts[:, None] + np.arange(top_k)]
+            winner_rows, winner_scores = rows[winners], scores[winners]
+            # Rows outside the bucket could still outrank (or tie) a weak bucket winner
+            trusted = winner_scores[:, -1] > OUTSIDE_BUCKET_MAX_SCORE
+            for j in np.flatnonzero(trusted):
+                hits[specs[j]] = winner_rows[j], winner_scores[j]
+        return hits
+    
+    def score_catalog(self, rfp_spec: Dict) -> np.ndarray:
+        """Score every catalog row at once (same weights as calculate_exact_match)"""
+        return self.score_matrix([rfp_spec])[0]
+    
+    def score_matrix(self, rfp_specs: List[Dict], rows: np.ndarray = None) -> np.ndarray:
+        """Score a (specs x catalog) matrix in one pass, optionally over a subset of rows"""
+        select = slice(None) if rows is None else rows
+        spec_codes = np.array([self._spec_codes(spec) for spec in rfp_specs], dtype=int).reshape(len(rfp_specs), -1)
+        rfp_core = np.array([float(spec.get("core_count", 0)) for spec in rfp_specs])
+        return self._score(spec_codes[:, None, :], rfp_core[:, None], select)
+    
+    def _score(self, spec_codes: np.ndarray, rfp_core: np.ndarray, rows) -> np.ndarray:
+        """Scores of spec codes (..., 4) and core counts against catalog rows, broadcast together
+
+        Same weights as calculate_exact_match.
+        """
+        core_count = self._core_count[rows]
+        
+        # ===== MANDATORY SPECS (40% weight) =====
+        mandatory_matches = sum(spec_codes[..., field] == codes[rows]
+                                for field, codes in enumerate(self._mandatory_codes))
+        score = 0.40 * ((mandatory_matches / 4) * 100)
+        
+        # ===== PERFORMANCE SPECS (30% weight) =====
+        performance_score = np.where((rfp_core > 0) & (core_count > 0), 80.0, 85.0)
+        performance_score = np.where(rfp_core == core_count, 100.0, performance_score)
+        score = score + 0.30 * performance_score
+        
+        # ===== CERTIFICATIONS (20% weight) =====
+        score += 0.20 * self._cert_score[rows]
+        
+        # ===== COST (10% weight) =====
+        score += 0.10 * 100.0
+        
+        return np.round(score, 1)
+    
+    @staticmethod
+    def _select_top_k(scores: np.ndarray, top_k: int) -> np.ndarray:
+        """Indices of the top-K scores, ties broken by catalog order like a stable sort"""
+        n = len(scores)
+        if top_k <= 0 or n == 0:
+            return np.array([], dtype=int)
+        if top_k < n:
+            # Partial selection: the K-th largest score is the admission threshold
+            kth = np.partition(scores, n - top_k)[n - top_k]
+            above = np.flatnonzero(scores > kth)
+            tied = np.flatnonzero(scores == kth)[:top_k - len(above)]
+            candidates = np.concatenate([above, tied])
+        else:
+            candidates = np.arange(n)
+        order = np.lexsort((candidates, -scores[candidates]))
+        return candidates[order]
     
     def calculate_exact_match(self, rfp_spec: Dict, product_row) -> Tuple[float, Dict]:
         """
@@ -72,27 +209,84 @@ class SpecMatcher:
         
         return round(score, 1), match_details
     
+    def _build_match(self, product_row, match_score: float, details: Dict) -> Dict:
+        """Build the match record returned for one catalog row"""
+        return {
+            "rank": None,  # Will be set later
+            "sku": product_row["product_sku"],
+            "match_score": match_score,
+            "details": details,
+            "unit_price": float(product_row["unit_price_per_meter"]),
+            "lead_time": int(product_row["lead_time_days"]),
+            "voltage": float(product_row["voltage_rating_kv"]),
+            "conductor_size": float(product_row["conductor_size_mm2"]),
+            "material": product_row["material"],
+            "insulation": product_row["insulation_type"],
+            "temperature": int(product_row["temperature_rating_celsius"]),
+        }
+    
+    @instrument("spec_matcher.find_top_matches")
     def find_top_matches(self, rfp_product: Dict, top_k: int = 3) -> List[Tuple]:
         """Find top-K matching SKUs from catalog"""
+        if not self.vectorized:
+            return self._find_top_matches_rowwise(rfp_product, top_k)
+        return self.find_top_matches_batch([rfp_product], top_k)[0]
+    
+    @instrument("spec_matcher.find_top_matches_batch")
+    def find_top_matches_batch(self, rfp_products: List[Dict], top_k: int = 3,
+                               max_cells: int = 4_000_000) -> List[List[Dict]]:
+        """Find top-K matching SKUs for many RFP line items in one matrix pass"""
+        if not self.vectorized:
+            return [self._find_top_matches_rowwise(product, top_k) for product in rfp_products]
+        
+        winners: List[np.ndarray] = [None] * len(rfp_products)
+        
+        # Most specs resolve from their exact-match bucket without touching the catalog
+        unresolved = []
+        for i, hit in enumerate(self._lookup_buckets(rfp_products, top_k, min(max_cells, BUCKET_PAIRS_PER_CHUNK))):
+            if hit is None:
+                unresolved.append(i)
+            else:
+                winners[i] = hit[0]
+        
+        # Chunk the spec axis so the score matrix stays under max_cells entries
+        chunk = max(1, max_cells // max(1, len(self.catalog)))
+        for start in range(0, len(unresolved), chunk):
+            batch = unresolved[start:start + chunk]
+            scores = self.score_matrix([rfp_products[i] for i in batch])
+            for i, row_scores in zip(batch, scores):
+                winners[i] = self._select_top_k(row_scores, top_k)
+        return self._collect_matches(rfp_products, winners)
+    
+    def _collect_matches(self, rfp_products: List[Dict], winners: List[np.ndarray]) -> List[List[Dict]]:
+        """Build ranked match records for each spec's winning catalog rows"""
+        # One gather per column for every winner, then plain dicts instead of iloc rows
+        flat = np.concatenate(winners) if winners else np.array([], dtype=int)
+        values = {column: array[flat].tolist() for column, array in self._detail_columns.items()}
+        rows = [dict(zip(values, row)) for row in zip(*values.values())]
+        
+        results = []
+        offset = 0
+        for rfp_product, spec_winners in zip(rfp_products, winners):
+            matches = []
+            # Only the winners get the human-readable match details
+            for rank, product_row in enumerate(rows[offset:offset + len(spec_winners)], 1):
+                match_score, details = self.calculate_exact_match(rfp_product, product_row)
+                match = self._build_match(product_row, match_score, details)
+                match["rank"] = rank
+                matches.append(match)
+            offset += len(spec_winners)
+            results.append(matches)
+        return results
+    
+    def _find_top_matches_rowwise(self, rfp_product: Dict, top_k: int = 3) -> List[Tuple]:
+        """Reference implementation scoring one catalog row at a time"""
         
         matches = []
         
         for idx, product_row in self.catalog.iterrows():
             match_score, details = self.calculate_exact_match(rfp_product, product_row)
-            
-            matches.append({
-                "rank": None,  # Will be set later
-                "sku": product_row["product_sku"],
-                "match_score": match_score,
-                "details": details,
-                "unit_price": float(product_row["unit_price_per_meter"]),
-                "lead_time": int(product_row["lead_time_days"]),
-                "voltage": float(product_row["voltage_rating_kv"]),
-                "conductor_size": float(product_row["conductor_size_mm2"]),
-                "material": product_row["material"],
-                "insulation": product_row["insulation_type"],
-                "temperature": int(product_row["temperature_rating_celsius"]),
-            })
+            matches.append(self._build_match(product_row, match_score, details))
         
         # Sort by match score
         matches = sorted(matches, key=lambda x: x["match_score"], reverse=True)